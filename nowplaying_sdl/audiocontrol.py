@@ -29,6 +29,9 @@ class AudioControlClient:
         self.api_url = api_url.rstrip('/')
         self.update_interval = update_interval
         self.current_data = {}
+        # Bumped whenever current_data is replaced with changed content, so
+        # readers can skip re-reading an unchanged snapshot
+        self.data_version = 0
         self.running = False
         self.thread = None
         self.error = None
@@ -41,7 +44,7 @@ class AudioControlClient:
         """Fetch the current now playing information from the AudioControl API"""
         try:
             url = f"{self.api_url}/now-playing"
-            logger.debug(f"Fetching now playing from: {url}")
+            logger.debug("Fetching now playing from: %s", url)
             
             request = urllib.request.Request(
                 url,
@@ -51,7 +54,7 @@ class AudioControlClient:
             with urllib.request.urlopen(request, timeout=5) as response:
                 data = response.read().decode('utf-8')
                 result = json.loads(data)
-                logger.debug(f"API response: {result}")
+                logger.debug("API response: %s", result)
                 
                 # Also fetch player information
                 try:
@@ -63,9 +66,9 @@ class AudioControlClient:
                     with urllib.request.urlopen(player_request, timeout=5) as player_response:
                         player_data = json.loads(player_response.read().decode('utf-8'))
                         result["player_info"] = player_data
-                        logger.debug(f"Player info: {player_data}")
+                        logger.debug("Player info: %s", player_data)
                 except Exception as e:
-                    logger.debug(f"Could not fetch player info: {e}")
+                    logger.debug("Could not fetch player info: %s", e)
                 
                 self.error = None
                 return result
@@ -131,7 +134,7 @@ class AudioControlClient:
             title = song.get("title", "")
             album = song.get("album", "")
         
-        logger.debug(f"Formatted data - title: {title}, artist: {artist}, cover_url: {cover_url}")
+        logger.debug("Formatted data - title: %s, artist: %s, cover_url: %s", title, artist, cover_url)
         
         # Check if this track is in favorites
         is_fav = self.is_favorite(title, artist) if title and artist else False
@@ -170,7 +173,9 @@ class AudioControlClient:
                 logger.info(f"Playback state changed: {self.previous_state} -> {current_state}")
                 self.previous_state = current_state
             
-            self.current_data = new_data
+            if new_data != self.current_data:
+                self.current_data = new_data
+                self.data_version += 1
             time.sleep(self.update_interval)
     
     def start(self):
@@ -185,6 +190,7 @@ class AudioControlClient:
         # Do initial fetch synchronously
         raw_data = self.fetch_now_playing()
         self.current_data = self.format_now_playing(raw_data)
+        self.data_version += 1
         
         # Check if favorites API is available
         self.check_favorites_support()
@@ -211,7 +217,7 @@ class AudioControlClient:
         
         try:
             url = f"{self.api_url}/favourites/providers"
-            logger.debug(f"Checking favorites providers: {url}")
+            logger.debug("Checking favorites providers: %s", url)
             
             request = urllib.request.Request(
                 url,
@@ -221,7 +227,7 @@ class AudioControlClient:
             with urllib.request.urlopen(request, timeout=5) as response:
                 data = response.read().decode('utf-8')
                 result = json.loads(data)
-                logger.debug(f"Favorites providers response: {result}")
+                logger.debug("Favorites providers response: %s", result)
                 
                 # Check if there are any enabled providers
                 enabled_count = result.get('enabled_count', 0)
@@ -277,7 +283,7 @@ class AudioControlClient:
             import urllib.parse
             params = urllib.parse.urlencode({'artist': artist, 'title': title})
             url = f"{self.api_url}/favourites/is_favourite?{params}"
-            logger.debug(f"Checking if favorite: {url}")
+            logger.debug("Checking if favorite: %s", url)
             
             request = urllib.request.Request(
                 url,
@@ -287,7 +293,7 @@ class AudioControlClient:
             with urllib.request.urlopen(request, timeout=5) as response:
                 data = response.read().decode('utf-8')
                 result = json.loads(data)
-                logger.debug(f"is_favourite response: {result}")
+                logger.debug("is_favourite response: %s", result)
                 
                 # Mark as supported
                 self.favorites_supported = True
@@ -473,7 +479,7 @@ class AudioControlClient:
             # Use player_name if provided, otherwise default to 'active'
             player = player_name if player_name else 'active'
             url = f"{self.api_url}/player/{player}/command/{command}"
-            logger.debug(f"Sending player command '{command}' to player '{player}'")
+            logger.debug("Sending player command '%s' to player '%s'", command, player)
             
             request = urllib.request.Request(
                 url,
@@ -486,7 +492,7 @@ class AudioControlClient:
                 result = json.loads(data)
                 
                 if result.get('success'):
-                    logger.debug(f"Command '{command}' sent successfully to '{player}'")
+                    logger.debug("Command '%s' sent successfully to '%s'", command, player)
                     return True
                 else:
                     logger.warning(f"Command '{command}' failed for '{player}': {result.get('message')}")
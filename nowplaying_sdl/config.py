@@ -62,6 +62,7 @@ class Config:
         """
         self.config_file = self._find_config_file(config_file)
         self.config = self._load_config()
+        self._section_cache: Dict[str, Dict[str, str]] = {}
     
     def _find_config_file(self, config_file: Optional[str]) -> Optional[str]:
         """Find config file in order of preference"""
@@ -138,6 +139,22 @@ class Config:
         except (ValueError, TypeError):
             return float(self.DEFAULTS.get(key, 0.0))
     
+    def as_dict(self, section: str = 'nowplaying') -> Dict[str, str]:
+        """Get all values of a section as a plain dict (cached)
+        
+        Includes the DEFAULT-section fallbacks, so lookups match get().
+        Callers coerce types themselves; repeated calls return the same
+        dict without re-walking the parser.
+        """
+        cached = self._section_cache.get(section)
+        if cached is None:
+            if section in self.config:
+                cached = dict(self.config[section])
+            else:
+                cached = dict(self.config['DEFAULT'])
+            self._section_cache[section] = cached
+        return cached
+    
     def merge_args(self, args) -> None:
         """Merge command-line arguments into config (args take precedence)"""
         # Command-line args override config file
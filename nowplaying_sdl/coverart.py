@@ -58,12 +58,12 @@ class CoverArtCache:
             logger.debug("No cover URL provided")
             return None
         
-        logger.debug(f"Getting cover art for URL: {url}")
+        logger.debug("Getting cover art for URL: %s", url)
         
         # Check if already cached
         cache_path = self._get_cache_path(url)
         if cache_path.exists():
-            logger.debug(f"Cover art found in cache: {cache_path}")
+            logger.debug("Cover art found in cache: %s", cache_path)
             return str(cache_path)
         
         # Download the image
@@ -76,7 +76,7 @@ class CoverArtCache:
             
             with urllib.request.urlopen(request, timeout=10) as response:
                 data = response.read()
-                logger.debug(f"Downloaded {len(data)} bytes")
+                logger.debug("Downloaded %d bytes", len(data))
                 
                 # Save to cache
                 with open(cache_path, 'wb') as f:
@@ -8,7 +8,6 @@ import sdl2.ext
 import sdl2.sdlttf as sdlttf
 import sdl2.sdlimage as sdlimage
 import sys
-import argparse
 import os
 import logging
 from pathlib import Path
@@ -21,11 +20,16 @@ from .renderer import (
     draw_rounded_rect,
     render_text,
     render_text_centered,
+    clear_text_texture_cache,
+    clear_rounded_rect_cache,
     wrap_text,
     truncate_text,
     render_wrapped_text_centered
 )
 from .ui import (
+    clear_background_cache,
+    close_cached_fonts,
+    prewarm_button_icons,
     draw_now_playing_ui_portrait,
     draw_now_playing_ui_landscape,
     draw_now_playing_ui_circle,
@@ -123,6 +127,10 @@ def render_coverart(renderer, x, y, size, imagefile, font_icons, rotation=0, scr
 
 def parse_arguments():
     """Parse command-line arguments"""
+    # argparse (and its re/gettext import chain) is only needed here, so
+    # keep it out of module import time
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Now Playing Display - Shows currently playing media'
     )
@@ -286,6 +294,71 @@ def draw_now_playing_ui(renderer, width, height, font_large, font_medium, font_s
         return draw_now_playing_ui_landscape(renderer, width, height, font_large, font_medium, font_icons, bw_buttons, no_control, minimal_buttons, liked, rotation, screen_width, screen_height, demo, now_playing_data, cover_cache, hide_like_button, round_controls, debug, left_button, volume_slider, volume)
 
 
+def make_draw_frame(renderer, width, height, font_large, font_medium, font_small, font_icons,
+                    is_portrait, is_circle, is_circle2, bw_buttons, no_control, minimal_buttons,
+                    rotation, screen_width, screen_height, demo, cover_cache, round_controls,
+                    debug, left_button, volume_slider):
+    """Build a per-frame draw callable with run-constant arguments bound
+    
+    The layout mode, rotation, fonts and CLI flags never change for the
+    lifetime of a run, so resolve the concrete draw function and capture
+    those arguments once instead of re-dispatching through
+    draw_now_playing_ui and re-passing two dozen constants every frame.
+    
+    Returns a callable draw_frame(liked, now_playing_data, hide_like_button, volume)
+    that returns the button positions dict.
+    """
+    if is_circle2:
+        def draw_frame(liked, now_playing_data, hide_like_button, volume):
+            return draw_now_playing_ui_circle2(renderer, width, height, font_large, font_medium, font_small, font_icons, bw_buttons, no_control, minimal_buttons, liked, rotation, screen_width, screen_height, demo, now_playing_data, cover_cache, hide_like_button, round_controls, debug, left_button)
+    elif is_circle:
+        def draw_frame(liked, now_playing_data, hide_like_button, volume):
+            return draw_now_playing_ui_circle(renderer, width, height, font_large, font_medium, font_small, font_icons, bw_buttons, no_control, minimal_buttons, liked, rotation, screen_width, screen_height, demo, now_playing_data, cover_cache, hide_like_button, round_controls, debug, left_button)
+    elif is_portrait:
+        def draw_frame(liked, now_playing_data, hide_like_button, volume):
+            return draw_now_playing_ui_portrait(renderer, width, height, font_large, font_medium, font_small, font_icons, bw_buttons, no_control, minimal_buttons, liked, rotation, screen_width, screen_height, demo, now_playing_data, cover_cache, hide_like_button, round_controls, debug, left_button, volume_slider, volume)
+    else:
+        def draw_frame(liked, now_playing_data, hide_like_button, volume):
+            return draw_now_playing_ui_landscape(renderer, width, height, font_large, font_medium, font_icons, bw_buttons, no_control, minimal_buttons, liked, rotation, screen_width, screen_height, demo, now_playing_data, cover_cache, hide_like_button, round_controls, debug, left_button, volume_slider, volume)
+    return draw_frame
+
+
+def find_font(paths):
+    """Return the first existing path from a list of font candidates
+    
+    Args:
+        paths: Candidate font file paths (bytes)
+    
+    Returns:
+        The first path that exists on disk, or None
+    """
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _cfg_bool(value):
+    """Interpret a config string as a boolean"""
+    return value.lower() in ('true', 'yes', '1', 'on')
+
+
+def _cfg_int(value, default=0):
+    """Interpret a config string as an integer"""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _cfg_float(value, default=0.0):
+    """Interpret a config string as a float"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
 def main():
     """Main application entry point"""
     args = parse_arguments()
@@ -302,59 +375,65 @@ def main():
     logger.info(f"Starting nowplaying-sdl (log level: {'DEBUG' if args.debug else 'INFO'})")
     
     # Load configuration
-    config = Config(args.config if hasattr(args, 'config') else None)
+    config = Config(args.config)
+    
+    # Merge command-line args with config (args take precedence).
+    # Materialize each section once instead of walking the parser per key.
+    cfg = config.as_dict()
+    cfg_display = config.as_dict('display')
+    cfg_ui = config.as_dict('ui')
+    cfg_screensaver = config.as_dict('screensaver')
     
-    # Merge command-line args with config (args take precedence)
     # Apply config defaults where args are not specified
     if args.api_url is None:
-        args.api_url = config.get('api_url')
+        args.api_url = cfg.get('api_url', '')
     if args.poll_interval == 2.0:
-        args.poll_interval = config.get_float('poll_interval')
+        args.poll_interval = _cfg_float(cfg.get('poll_interval'), 2.0)
     if not args.demo:
-        args.demo = config.get_bool('demo')
+        args.demo = _cfg_bool(cfg.get('demo', 'false'))
     
     # Display settings from [display] section
     if args.display is None:
-        args.display = config.get_int('display', 'display')
+        args.display = _cfg_int(cfg_display.get('display'))
     if args.rotation is None:
-        args.rotation = config.get_int('rotation', 'display')
+        args.rotation = _cfg_int(cfg_display.get('rotation'))
     
     # UI settings from [ui] section
     if not args.portrait and not args.landscape and not args.circle and not args.circle2:
-        if config.get_bool('circle2', 'ui'):
+        if _cfg_bool(cfg_ui.get('circle2', 'false')):
             args.circle2 = True
-        elif config.get_bool('circle', 'ui'):
+        elif _cfg_bool(cfg_ui.get('circle', 'false')):
             args.circle = True
-        elif config.get_bool('portrait', 'ui'):
+        elif _cfg_bool(cfg_ui.get('portrait', 'false')):
             args.portrait = True
-        elif config.get_bool('landscape', 'ui'):
+        elif _cfg_bool(cfg_ui.get('landscape', 'false')):
             args.landscape = True
     if not args.bw_buttons:
-        args.bw_buttons = config.get_bool('bw_buttons', 'ui')
+        args.bw_buttons = _cfg_bool(cfg_ui.get('bw_buttons', 'false'))
     if not args.no_control:
-        args.no_control = config.get_bool('no_control', 'ui')
+        args.no_control = _cfg_bool(cfg_ui.get('no_control', 'false'))
     if not args.minimal_buttons:
-        args.minimal_buttons = config.get_bool('minimal_buttons', 'ui')
+        args.minimal_buttons = _cfg_bool(cfg_ui.get('minimal_buttons', 'false'))
     if not args.liked:
-        args.liked = config.get_bool('liked', 'ui')
+        args.liked = _cfg_bool(cfg_ui.get('liked', 'false'))
     if not args.volume_slider:
-        args.volume_slider = config.get_bool('volume_slider', 'ui')
+        args.volume_slider = _cfg_bool(cfg_ui.get('volume_slider', 'false'))
     if not args.round_controls:
-        args.round_controls = config.get_bool('round_controls', 'ui')
+        args.round_controls = _cfg_bool(cfg_ui.get('round_controls', 'false'))
     if args.left_button == 'none':
-        args.left_button = config.get('left_button', 'ui')
+        args.left_button = cfg_ui.get('left_button', 'none')
     
     # Screensaver settings: command-line args take precedence over config
     if args.screensaver_brightness_off == 0:
-        args.screensaver_brightness_off = config.get_int('brightness_off', 'screensaver')
+        args.screensaver_brightness_off = _cfg_int(cfg_screensaver.get('brightness_off'))
     if args.screensaver_brightness_dimmed == 5:
-        args.screensaver_brightness_dimmed = config.get_int('brightness_dimmed', 'screensaver')
+        args.screensaver_brightness_dimmed = _cfg_int(cfg_screensaver.get('brightness_dimmed'), 5)
     if args.screensaver_brightness_on == 16:
-        args.screensaver_brightness_on = config.get_int('brightness_on', 'screensaver')
+        args.screensaver_brightness_on = _cfg_int(cfg_screensaver.get('brightness_on'), 16)
     if args.screensaver_dimming == 60:
-        args.screensaver_dimming = config.get_int('dimming', 'screensaver')
+        args.screensaver_dimming = _cfg_int(cfg_screensaver.get('dimming'), 60)
     if args.screensaver_off == 600:
-        args.screensaver_off = config.get_int('off', 'screensaver')
+        args.screensaver_off = _cfg_int(cfg_screensaver.get('off'), 600)
     
     # Initialize SDL
     if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO) != 0:
@@ -397,8 +476,8 @@ def main():
         screen_is_portrait = display_mode.h > display_mode.w
         
         # Determine display mode (circle, circle2, portrait, or landscape)
-        is_circle = args.circle if hasattr(args, 'circle') else False
-        is_circle2 = args.circle2 if hasattr(args, 'circle2') else False
+        is_circle = args.circle
+        is_circle2 = args.circle2
         
         if is_circle or is_circle2:
             # Circle mode: orientation validation doesn't apply
@@ -454,7 +533,8 @@ def main():
             logger.error(f"Error creating window: {sdl2.SDL_GetError()}")
             return 1
         
-        # Create renderer
+        # Create renderer - ask SDL to batch draw calls regardless of backend
+        sdl2.SDL_SetHint(b"SDL_RENDER_BATCHING", b"1")
         renderer = sdl2.SDL_CreateRenderer(
             window,
             -1,
@@ -480,40 +560,36 @@ def main():
             b"/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
         ]
         
+        # Resolve each candidate list to a single path up front, then open
+        # all sizes from it, instead of attempting TTF_OpenFont per path
+        # and size
+        bold_path = find_font(font_paths_bold)
+        regular_path = find_font(font_paths_regular)
+        
         font_large = None
-        for path in font_paths_bold:
-            try:
-                font_large = sdlttf.TTF_OpenFont(path, 48)
-                if font_large:
-                    logger.info(f"Loaded bold font from: {path.decode('utf-8')}")
-                    break
-            except:
-                continue
+        if bold_path:
+            font_large = sdlttf.TTF_OpenFont(bold_path, 48)
+            if font_large:
+                logger.info(f"Loaded bold font from: {bold_path.decode('utf-8')}")
         
         font_medium = None
-        for path in font_paths_regular:
-            try:
-                font_medium = sdlttf.TTF_OpenFont(path, 42)
-                if font_medium:
-                    logger.info(f"Loaded medium font from: {path.decode('utf-8')}")
-                    break
-            except:
-                continue
-        
         font_small = None
-        for path in font_paths_regular:
-            try:
-                font_small = sdlttf.TTF_OpenFont(path, 24)
-                if font_small:
-                    break
-            except:
-                continue
+        if regular_path:
+            font_medium = sdlttf.TTF_OpenFont(regular_path, 42)
+            if font_medium:
+                logger.info(f"Loaded medium font from: {regular_path.decode('utf-8')}")
+            font_small = sdlttf.TTF_OpenFont(regular_path, 24)
         font_icons_path = get_resource_path('fonts/MaterialSymbolsRounded.ttf')
         font_icons = sdlttf.TTF_OpenFont(font_icons_path.encode('utf-8'), 48)
         
         if not font_large or not font_medium or not font_small or not font_icons:
             logger.error(f"Error loading fonts: {sdlttf.TTF_GetError()}")
         
+        # Pre-render the fixed button icons so the first frame and the first
+        # icon change (play/pause, like) are as fast as steady state
+        if font_icons:
+            prewarm_button_icons(renderer, font_icons)
+        
         # Initialize AudioControl client if not in demo mode
         ac_client = None
         if not args.demo:
@@ -549,10 +625,31 @@ def main():
         layout_width = display_mode.h if args.rotation in (90, 270) else display_mode.w
         layout_height = display_mode.w if args.rotation in (90, 270) else display_mode.h
         
+        # Offscreen frame texture sized to the unrotated layout: the whole UI
+        # is drawn into it without any rotation math, then rotated and
+        # presented as a single GPU blit
+        frame_tex = sdl2.SDL_CreateTexture(
+            renderer,
+            sdl2.SDL_PIXELFORMAT_RGBA8888,
+            sdl2.SDL_TEXTUREACCESS_TARGET,
+            layout_width,
+            layout_height
+        )
+        if not frame_tex:
+            logger.warning(f"Render-target textures unavailable, drawing directly: {sdl2.SDL_GetError()}")
+        
+        # Destination rect for the rotated blit: the layout rect centered on
+        # the screen, rotated about its own center by SDL_RenderCopyEx. For
+        # 90/270 the centered rect overhangs horizontally/vertically exactly
+        # so that the rotated result fills the screen.
+        frame_dst = sdl2.SDL_Rect((display_mode.w - layout_width) // 2,
+                                  (display_mode.h - layout_height) // 2,
+                                  layout_width, layout_height)
+        
         # Get now playing data
         now_playing_data = ac_client.get_current_data() if ac_client else None
         if now_playing_data:
-            logger.debug(f"Initial now playing data: {now_playing_data}")
+            logger.debug("Initial now playing data: %s", now_playing_data)
         
         # Get initial liked state from API if available
         if now_playing_data and not args.demo:
@@ -566,29 +663,143 @@ def main():
         # Check if favorites are supported (hide like button if not, unless no_control mode where we ONLY show like button)
         hide_like = not args.demo and ac_client and ac_client.favorites_supported is False and not args.no_control
         
-        try:
-            button_rects = [draw_now_playing_ui(renderer, layout_width, layout_height, 
-                              font_large, font_medium, font_small, font_icons, is_portrait, 
-                              args.bw_buttons, args.no_control, args.minimal_buttons, liked_state[0], 
-                              args.rotation, display_mode.w, display_mode.h, args.demo, now_playing_data, cover_cache, is_circle, is_circle2, hide_like, args.round_controls, args.debug, args.left_button, args.volume_slider, volume_state[0])]
+        # Resolve the draw function and bind run-constant arguments once.
+        # With the offscreen layout texture the draw functions run entirely
+        # in layout coordinates (rotation 0); the rotation happens once at
+        # present time. Without render targets, fall back to the in-draw
+        # coordinate transforms.
+        if frame_tex:
+            draw_frame = make_draw_frame(renderer, layout_width, layout_height,
+                              font_large, font_medium, font_small, font_icons,
+                              is_portrait, is_circle, is_circle2,
+                              args.bw_buttons, args.no_control, args.minimal_buttons,
+                              0, layout_width, layout_height, args.demo,
+                              cover_cache, args.round_controls, args.debug, args.left_button, args.volume_slider)
+        else:
+            draw_frame = make_draw_frame(renderer, layout_width, layout_height,
+                              font_large, font_medium, font_small, font_icons,
+                              is_portrait, is_circle, is_circle2,
+                              args.bw_buttons, args.no_control, args.minimal_buttons,
+                              args.rotation, display_mode.w, display_mode.h, args.demo,
+                              cover_cache, args.round_controls, args.debug, args.left_button, args.volume_slider)
+        
+        def render_frame(liked, data, hide_like_button, volume):
+            """Draw one full frame (into the offscreen layout target if
+            available), rotate it to the screen and present it, returning
+            the button positions"""
+            if frame_tex:
+                sdl2.SDL_SetRenderTarget(renderer, frame_tex)
+            rects = draw_frame(liked, data, hide_like_button, volume)
+            if frame_tex:
+                sdl2.SDL_SetRenderTarget(renderer, None)
+                sdl2.SDL_RenderCopyEx(renderer, frame_tex, None, frame_dst,
+                                      args.rotation, None, sdl2.SDL_FLIP_NONE)
             sdl2.SDL_RenderPresent(renderer)
+            return rects
+        
+        def make_hit_list(rects):
+            """Flatten button rects into (name, x0, x1, y0, y1) tuples for
+            fast hit testing"""
+            if not rects:
+                return ()
+            return tuple((name, bx, bx + bw, by, by + bh)
+                         for name, (bx, by, bw, bh) in rects.items())
+        
+        try:
+            button_rects = [render_frame(liked_state[0], now_playing_data, hide_like, volume_state[0])]
         except Exception as e:
             logger.error(f"Error drawing initial UI: {e}", exc_info=True)
             return 1
+        hit_list = [make_hit_list(button_rects[0])]
         
         def check_button_hit(x, y):
             """Check if coordinates hit any button, return button name or None"""
-            rects = button_rects[0]
-            if not rects:
-                return None
-            for button_name, (bx, by, bw, bh) in rects.items():
-                if bx <= x <= bx + bw and by <= y <= by + bh:
+            # Button rects are in layout coordinates; when the scene is drawn
+            # unrotated and rotated at present time, map the physical touch
+            # point back into layout space first
+            if frame_tex:
+                if args.rotation == 90:
+                    x, y = y, display_mode.w - x
+                elif args.rotation == 180:
+                    x, y = display_mode.w - x, display_mode.h - y
+                elif args.rotation == 270:
+                    x, y = display_mode.h - y, x
+            for button_name, x0, x1, y0, y1 in hit_list[0]:
+                if x0 <= x <= x1 and y0 <= y <= y1:
                     return button_name
             return None
         
+        def handle_press(x, y):
+            """Hit-test a press at physical screen coordinates and run the
+            matching button action (shared by touch and mouse events)"""
+            button = check_button_hit(x, y)
+            if not button:
+                return
+            logger.info(f"Button pressed: {button}")
+            
+            # Get player name from now_playing_data
+            player_name = now_playing_data.get('player_name') if now_playing_data else None
+            
+            if button == 'left':
+                # Handle left button based on mode
+                if args.left_button == 'random':
+                    logger.info("Random button pressed - not yet implemented")
+                    # TODO: Implement random/shuffle functionality
+                elif args.left_button == 'loop':
+                    logger.info("Loop button pressed - not yet implemented")
+                    # TODO: Implement loop/repeat functionality
+                elif args.left_button == 'lyrics':
+                    logger.info("Lyrics button pressed - not yet implemented")
+                    # TODO: Implement lyrics display functionality
+            elif button == 'prev':
+                if ac_client and not args.demo:
+                    ac_client.previous_track(player_name)
+            elif button == 'play':
+                if ac_client and not args.demo:
+                    ac_client.play_pause(player_name)
+            elif button == 'next':
+                if ac_client and not args.demo:
+                    ac_client.next_track(player_name)
+            elif button == 'like':
+                if args.demo:
+                    # In demo mode, just toggle locally
+                    liked_state[0] = not liked_state[0]
+                elif ac_client and now_playing_data:
+                    # Call API to toggle favorite
+                    title = now_playing_data.get('title', '')
+                    artist = now_playing_data.get('artist', '')
+                    album = now_playing_data.get('album')
+                    if title and artist:
+                        liked_state[0] = ac_client.toggle_favorite(title, artist, album)
+                        logger.info(f"Favorite toggled: {liked_state[0]}")
+                else:
+                    liked_state[0] = not liked_state[0]
+                logger.info(f"Liked: {liked_state[0]}")
+        
         logger.info("Entering main event loop")
 
+        # Redraw tracking: only rebuild the UI when the displayed state
+        # actually changed or an interaction happened
+        dirty = False
+        last_state_key = None
+        
+        # How long to sleep between loop iterations; the AudioControl client
+        # polls in its own thread, so waking faster than its update interval
+        # only re-reads unchanged data
+        poll_timeout_ms = max(50, int(args.poll_interval * 1000))
+        
+        # Data snapshot version already consumed; the client bumps its
+        # counter only when the polled data actually changed. Start at a
+        # sentinel so the first iteration always re-reads - the poll thread
+        # may have published a newer snapshot between the initial
+        # get_current_data() and here
+        last_data_version = -1
+
         while running:
+            # Sleep until an event arrives or the timeout elapses; a NULL
+            # event leaves the woken event queued for the drain loop below
+            sdl2.SDL_WaitEventTimeout(None, poll_timeout_ms)
+            
             # Handle events
             while sdl2.SDL_PollEvent(event) != 0:
                 if event.type == sdl2.SDL_QUIT:
@@ -601,101 +812,24 @@ def main():
                     # Reset activity timer on touch
                     logger.info(f"Touch event detected at ({event.tfinger.x:.3f}, {event.tfinger.y:.3f})")
                     screensaver.reset_activity()
+                    dirty = True
                     # Touch coordinates are normalized (0.0-1.0)
                     touch_x = int(event.tfinger.x * display_mode.w)
                     touch_y = int(event.tfinger.y * display_mode.h)
-                    button = check_button_hit(touch_x, touch_y)
-                    if button:
-                        logger.info(f"Button pressed: {button}")
-                        
-                        # Get player name from now_playing_data
-                        player_name = now_playing_data.get('player_name') if now_playing_data else None
-                        
-                        if button == 'left':
-                            # Handle left button based on mode
-                            if args.left_button == 'random':
-                                logger.info("Random button pressed - not yet implemented")
-                                # TODO: Implement random/shuffle functionality
-                            elif args.left_button == 'loop':
-                                logger.info("Loop button pressed - not yet implemented")
-                                # TODO: Implement loop/repeat functionality
-                            elif args.left_button == 'lyrics':
-                                logger.info("Lyrics button pressed - not yet implemented")
-                                # TODO: Implement lyrics display functionality
-                        elif button == 'prev':
-                            if ac_client and not args.demo:
-                                ac_client.previous_track(player_name)
-                        elif button == 'play':
-                            if ac_client and not args.demo:
-                                ac_client.play_pause(player_name)
-                        elif button == 'next':
-                            if ac_client and not args.demo:
-                                ac_client.next_track(player_name)
-                        elif button == 'like':
-                            if args.demo:
-                                # In demo mode, just toggle locally
-                                liked_state[0] = not liked_state[0]
-                            elif ac_client and now_playing_data:
-                                # Call API to toggle favorite
-                                title = now_playing_data.get('title', '')
-                                artist = now_playing_data.get('artist', '')
-                                album = now_playing_data.get('album')
-                                if title and artist:
-                                    liked_state[0] = ac_client.toggle_favorite(title, artist, album)
-                                    logger.info(f"Favorite toggled: {liked_state[0]}")
-                            else:
-                                liked_state[0] = not liked_state[0]
-                            logger.info(f"Liked: {liked_state[0]}")
+                    handle_press(touch_x, touch_y)
                 elif event.type == sdl2.SDL_MOUSEBUTTONDOWN:
                     # Reset activity timer on mouse click
                     logger.info(f"Mouse click detected at ({event.button.x}, {event.button.y})")
                     screensaver.reset_activity()
+                    dirty = True
                     # Mouse coordinates are in pixels
-                    button = check_button_hit(event.button.x, event.button.y)
-                    if button:
-                        logger.info(f"Button pressed: {button}")
-                        
-                        # Get player name from now_playing_data
-                        player_name = now_playing_data.get('player_name') if now_playing_data else None
-                        
-                        if button == 'left':
-                            # Handle left button based on mode
-                            if args.left_button == 'random':
-                                logger.info("Random button pressed - not yet implemented")
-                                # TODO: Implement random/shuffle functionality
-                            elif args.left_button == 'loop':
-                                logger.info("Loop button pressed - not yet implemented")
-                                # TODO: Implement loop/repeat functionality
-                            elif args.left_button == 'lyrics':
-                                logger.info("Lyrics button pressed - not yet implemented")
-                                # TODO: Implement lyrics display functionality
-                        elif button == 'prev':
-                            if ac_client and not args.demo:
-                                ac_client.previous_track(player_name)
-                        elif button == 'play':
-                            if ac_client and not args.demo:
-                                ac_client.play_pause(player_name)
-                        elif button == 'next':
-                            if ac_client and not args.demo:
-                                ac_client.next_track(player_name)
-                        elif button == 'like':
-                            if args.demo:
-                                # In demo mode, just toggle locally
-                                liked_state[0] = not liked_state[0]
-                            elif ac_client and now_playing_data:
-                                # Call API to toggle favorite
-                                title = now_playing_data.get('title', '')
-                                artist = now_playing_data.get('artist', '')
-                                album = now_playing_data.get('album')
-                                if title and artist:
-                                    liked_state[0] = ac_client.toggle_favorite(title, artist, album)
-                                    logger.info(f"Favorite toggled: {liked_state[0]}")
-                            else:
-                                liked_state[0] = not liked_state[0]
-                            logger.info(f"Liked: {liked_state[0]}")
+                    handle_press(event.button.x, event.button.y)
             
-            # Get latest now playing data
-            now_playing_data = ac_client.get_current_data() if ac_client else None
+            # Pick up a new data snapshot only when the poll thread
+            # published one
+            if ac_client and ac_client.data_version != last_data_version:
+                last_data_version = ac_client.data_version
+                now_playing_data = ac_client.get_current_data()
             
             # Determine if playback is active
             is_playing = False
@@ -706,9 +840,6 @@ def main():
             # Update screensaver state
             screensaver.update(is_playing)
             
-            # Clear renderer
-            sdl2.SDL_RenderClear(renderer)
-            
             # Update liked state from API if not in demo mode
             if now_playing_data and not args.demo:
                 liked_state[0] = now_playing_data.get('is_favorite', False)
@@ -717,21 +848,30 @@ def main():
             # Check if favorites are supported (hide like button if not, unless no_control mode where we ONLY show like button)
             hide_like = not args.demo and ac_client and ac_client.favorites_supported is False and not args.no_control
             
-            # Draw the Now Playing UI and get button positions
-            button_rects[0] = draw_now_playing_ui(renderer, layout_width, layout_height, 
-                              font_large, font_medium, font_small, font_icons, is_portrait, 
-                              args.bw_buttons, args.no_control, args.minimal_buttons, liked_state[0], 
-                              args.rotation, display_mode.w, display_mode.h, args.demo, now_playing_data, cover_cache, is_circle, is_circle2, hide_like, args.round_controls, args.debug, args.left_button, args.volume_slider, volume_state[0])
-            
-            # Present the rendered frame
-            sdl2.SDL_RenderPresent(renderer)
-            
-            # Small delay to prevent busy loop
-            sdl2.SDL_Delay(10)
+            # Skip the redraw entirely if nothing visible has changed
+            state_key = (
+                now_playing_data.get('title') if now_playing_data else None,
+                now_playing_data.get('artist') if now_playing_data else None,
+                now_playing_data.get('cover_url') if now_playing_data else None,
+                now_playing_data.get('state') if now_playing_data else None,
+                liked_state[0], volume_state[0], hide_like
+            )
+            if dirty or state_key != last_state_key:
+                # Draw the Now Playing UI and get button positions
+                button_rects[0] = render_frame(liked_state[0], now_playing_data, hide_like, volume_state[0])
+                hit_list[0] = make_hit_list(button_rects[0])
+                
+                last_state_key = state_key
+                dirty = False
         
         # Cleanup
         if ac_client:
             ac_client.stop()
+        screensaver.close()
+        clear_text_texture_cache()
+        clear_rounded_rect_cache()
+        clear_background_cache()
+        close_cached_fonts()
         if font_large:
             sdlttf.TTF_CloseFont(font_large)
         if font_medium:
@@ -740,6 +880,8 @@ def main():
             sdlttf.TTF_CloseFont(font_small)
         if font_icons:
             sdlttf.TTF_CloseFont(font_icons)
+        if frame_tex:
+            sdl2.SDL_DestroyTexture(frame_tex)
         sdl2.SDL_DestroyRenderer(renderer)
         sdl2.SDL_DestroyWindow(window)
         
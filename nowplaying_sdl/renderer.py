@@ -2,9 +2,96 @@
 SDL2 Rendering utilities with rotation support
 """
 
+import logging
+import math
+
 import sdl2
 import sdl2.sdlttf as sdlttf
 
+logger = logging.getLogger(__name__)
+
+# Reusable scratch structures for draw calls. SDL copies the values on each
+# call and rendering is single-threaded, so the same objects can be mutated
+# in place instead of allocating new ctypes structures for every draw.
+_scratch_rect = sdl2.SDL_Rect()
+_scratch_point = sdl2.SDL_Point()
+_rounded_rects = (sdl2.SDL_Rect * 7)()
+# Out-parameters for TTF_SizeText, reused for the same reason
+_scratch_w = sdl2.c_int()
+_scratch_h = sdl2.c_int()
+
+
+def _set_rect(rect, x, y, w, h):
+    """Fill an SDL_Rect in place"""
+    rect.x = x
+    rect.y = y
+    rect.w = w
+    rect.h = h
+    return rect
+
+
+# Cache of rendered string textures keyed by (font id, text). Strings are
+# rendered white once and tinted per draw with SDL_SetTextureColorMod, so the
+# same texture serves all colors. Titles, artists and icon labels repeat for
+# many frames, which makes re-rasterizing them through FreeType every frame
+# the dominant per-frame cost.
+_text_texture_cache = {}
+_TEXT_CACHE_MAX = 256
+_WHITE = sdl2.SDL_Color(255, 255, 255, 255)
+
+
+def _get_text_texture(renderer, font, text):
+    """Get a cached (texture, width, height) for a rendered string
+
+    Renders the string once in white and caches the resulting texture;
+    callers tint it with SDL_SetTextureColorMod. Least recently used
+    entries are evicted once the cache is full, so a long listening
+    session cannot accumulate textures for every title ever shown.
+
+    Returns:
+        Tuple of (SDL_Texture, width, height), or None if rendering failed
+    """
+    key = (id(font), text)
+    entry = _text_texture_cache.get(key)
+    if entry is not None:
+        # Re-insert to mark as most recently used (dicts keep insertion order)
+        _text_texture_cache.pop(key)
+        _text_texture_cache[key] = entry
+        return entry
+    surface = sdlttf.TTF_RenderUTF8_Blended(font, text.encode('utf-8'), _WHITE)
+    if not surface:
+        return None
+    texture = sdl2.SDL_CreateTextureFromSurface(renderer, surface)
+    entry = (texture, surface.contents.w, surface.contents.h)
+    sdl2.SDL_FreeSurface(surface)
+    if not texture:
+        return None
+    while len(_text_texture_cache) >= _TEXT_CACHE_MAX:
+        oldest_key = next(iter(_text_texture_cache))
+        old_texture, _, _ = _text_texture_cache.pop(oldest_key)
+        sdl2.SDL_DestroyTexture(old_texture)
+    _text_texture_cache[key] = entry
+    return entry
+
+
+def prewarm_text_textures(renderer, font, strings):
+    """Rasterize and cache a set of strings ahead of their first draw
+
+    Args:
+        renderer: SDL2 renderer
+        font: TTF font to render with
+        strings: Iterable of strings to pre-render
+    """
+    for text in strings:
+        _get_text_texture(renderer, font, text)
+
+
+def clear_text_texture_cache():
+    """Destroy all cached string textures (call when fonts are closed)"""
+    for texture, _, _ in _text_texture_cache.values():
+        sdl2.SDL_DestroyTexture(texture)
+    _text_texture_cache.clear()
+
 
 def transform_coordinates(x, y, width, height, screen_width, screen_height, rotation):
     """Transform coordinates based on rotation angle
@@ -84,17 +171,16 @@ def draw_volume_slider(renderer, x, y, width, height, volume, rotation=0, screen
     
     # Draw background bar (light gray)
     sdl2.SDL_SetRenderDrawColor(renderer, 200, 200, 200, 255)
-    bar_rect = sdl2.SDL_Rect(bar_x, bar_y, bar_width, bar_length)
-    sdl2.SDL_RenderFillRect(renderer, bar_rect)
+    sdl2.SDL_RenderFillRect(renderer, _set_rect(_scratch_rect, bar_x, bar_y, bar_width, bar_length))
     
     # Draw filled portion up to current volume (dark gray)
     volume_clamped = max(0, min(100, volume))
     if rotation in (90, 270):
         fill_length = int(height * volume_clamped / 100)
-        fill_rect = sdl2.SDL_Rect(bar_x, bar_y, bar_width, fill_length)
+        fill_rect = _set_rect(_scratch_rect, bar_x, bar_y, bar_width, fill_length)
     else:
         fill_width = int(width * volume_clamped / 100)
-        fill_rect = sdl2.SDL_Rect(bar_x, bar_y, fill_width, bar_length)
+        fill_rect = _set_rect(_scratch_rect, bar_x, bar_y, fill_width, bar_length)
     
     sdl2.SDL_SetRenderDrawColor(renderer, 80, 80, 80, 255)  # Dark gray
     sdl2.SDL_RenderFillRect(renderer, fill_rect)
@@ -127,13 +213,70 @@ def draw_filled_circle(renderer, center_x, center_y, radius, r, g, b, a):
         radius: Circle radius
         r, g, b, a: Color components
     """
+    sdl2.SDL_SetRenderDrawBlendMode(
+        renderer,
+        sdl2.SDL_BLENDMODE_NONE if a == 255 else sdl2.SDL_BLENDMODE_BLEND)
     sdl2.SDL_SetRenderDrawColor(renderer, r, g, b, a)
-    
-    # Draw filled circle using midpoint algorithm
-    for y in range(-radius, radius + 1):
-        for x in range(-radius, radius + 1):
-            if x * x + y * y <= radius * radius:
-                sdl2.SDL_RenderDrawPoint(renderer, center_x + x, center_y + y)
+
+    # Fill the disk as one horizontal span per scanline and submit them in
+    # a single batched call; per-pixel SDL_RenderDrawPoint over the whole
+    # bounding box cost (2r+1)^2 FFI crossings, most of them outside the
+    # circle. The span extents and the rect array are cached per radius,
+    # so repeat draws only translate the spans to the new center.
+    spans, rects = _get_disk_spans(radius)
+    for i, dx in enumerate(spans):
+        _set_rect(rects[i], center_x - dx, center_y - radius + i, 2 * dx + 1, 1)
+    sdl2.SDL_RenderFillRects(renderer, rects, len(spans))
+
+
+# Circle geometry caches: the slider handle and button outlines redraw
+# the same radii every frame, so the O(r) / O(r * thickness) coordinate
+# generation only needs to run once per distinct shape. The ctypes arrays
+# are reused as scratch output buffers (single-threaded rendering, and
+# SDL copies the values during the draw call).
+_disk_span_cache = {}
+_ring_span_cache = {}
+
+
+def _get_disk_spans(radius):
+    """Get (span extents, scratch rect array) for a filled circle"""
+    cached = _disk_span_cache.get(radius)
+    if cached is None:
+        r2 = radius * radius
+        spans = tuple(math.isqrt(r2 - y * y)
+                      for y in range(-radius, radius + 1))
+        cached = (spans, (sdl2.SDL_Rect * len(spans))())
+        _disk_span_cache[radius] = cached
+    return cached
+
+
+def _get_ring_spans(radius, thickness):
+    """Get (relative spans, scratch rect array) for a circle outline
+
+    Each span is (dy, start_x, width) relative to the center. Rows inside
+    the inner radius contribute a left and a right strip, rows beyond it a
+    single full strip.
+    """
+    key = (radius, thickness)
+    cached = _ring_span_cache.get(key)
+    if cached is None:
+        r_out = radius + thickness - 1
+        r_in = radius - 1
+        out2 = r_out * r_out
+        in2 = r_in * r_in
+        spans = []
+        for dy in range(-r_out, r_out + 1):
+            ox = math.isqrt(out2 - dy * dy)
+            if abs(dy) <= r_in:
+                ix = math.isqrt(in2 - dy * dy)
+                spans.append((dy, -ox, ox - ix))
+                spans.append((dy, ix + 1, ox - ix))
+            else:
+                spans.append((dy, -ox, 2 * ox + 1))
+        spans = tuple(spans)
+        cached = (spans, (sdl2.SDL_Rect * len(spans))())
+        _ring_span_cache[key] = cached
+    return cached
 
 
 def draw_circle(renderer, center_x, center_y, radius, r, g, b, a, thickness=1):
@@ -147,31 +290,97 @@ def draw_circle(renderer, center_x, center_y, radius, r, g, b, a, thickness=1):
         thickness: Line thickness (1 for thin line)
     """
     sdl2.SDL_SetRenderDrawColor(renderer, r, g, b, a)
-    
-    # Draw circle using midpoint circle algorithm
-    for t in range(thickness):
-        r_current = radius + t
-        x = r_current
-        y = 0
-        decision = 1 - x
-        
-        while x >= y:
-            # Draw 8 octants
-            sdl2.SDL_RenderDrawPoint(renderer, center_x + x, center_y + y)
-            sdl2.SDL_RenderDrawPoint(renderer, center_x + y, center_y + x)
-            sdl2.SDL_RenderDrawPoint(renderer, center_x - y, center_y + x)
-            sdl2.SDL_RenderDrawPoint(renderer, center_x - x, center_y + y)
-            sdl2.SDL_RenderDrawPoint(renderer, center_x - x, center_y - y)
-            sdl2.SDL_RenderDrawPoint(renderer, center_x - y, center_y - x)
-            sdl2.SDL_RenderDrawPoint(renderer, center_x + y, center_y - x)
-            sdl2.SDL_RenderDrawPoint(renderer, center_x + x, center_y - y)
-            
-            y += 1
-            if decision <= 0:
-                decision += 2 * y + 1
+
+    # Translate the cached annulus spans to the center and submit them in
+    # a single batched call; scanline spans cover the ring in O(r) rects
+    # where walking Bresenham once per thickness layer cost
+    # O(r * thickness) point draws and could leave gaps between layers
+    spans, rect_array = _get_ring_spans(radius, thickness)
+    for i, (dy, sx, sw) in enumerate(spans):
+        _set_rect(rect_array[i], center_x + sx, center_y + dy, sw, 1)
+    if spans:
+        sdl2.SDL_RenderFillRects(renderer, rect_array, len(spans))
+
+
+# Rounded-rect shapes baked to textures, keyed by (w, h, radius). The shape
+# is rendered white once and tinted per draw with color/alpha mod, so the
+# four control buttons cost one textured quad each instead of a fill pass.
+_rounded_rect_cache = {}
+
+
+def _get_rounded_rect_texture(renderer, w, h, radius):
+    """Get a cached white rounded-rect texture of the given geometry
+
+    Returns:
+        SDL_Texture with blended alpha, or None if render targets are
+        unavailable
+    """
+    key = (w, h, radius)
+    if key in _rounded_rect_cache:
+        return _rounded_rect_cache[key]
+    texture = sdl2.SDL_CreateTexture(renderer, sdl2.SDL_PIXELFORMAT_RGBA8888,
+                                     sdl2.SDL_TEXTUREACCESS_TARGET, w, h)
+    if texture:
+        previous_target = sdl2.SDL_GetRenderTarget(renderer)
+        sdl2.SDL_SetTextureBlendMode(texture, sdl2.SDL_BLENDMODE_BLEND)
+        sdl2.SDL_SetRenderTarget(renderer, texture)
+        sdl2.SDL_SetRenderDrawBlendMode(renderer, sdl2.SDL_BLENDMODE_NONE)
+        sdl2.SDL_SetRenderDrawColor(renderer, 0, 0, 0, 0)
+        sdl2.SDL_RenderClear(renderer)
+        # Bake with genuinely rounded corners: one span per row, with the
+        # corner rows inset along a quarter-circle arc. This runs once per
+        # geometry, so the per-row cost is irrelevant; draws stay a single
+        # textured quad.
+        sdl2.SDL_SetRenderDrawColor(renderer, 255, 255, 255, 255)
+        r2 = radius * radius
+        rows = (sdl2.SDL_Rect * h)()
+        for row in range(h):
+            if row < radius:
+                dy = radius - row
+                inset = radius - math.isqrt(r2 - dy * dy)
+            elif row >= h - radius:
+                dy = row - (h - radius - 1)
+                inset = radius - math.isqrt(max(0, r2 - dy * dy))
             else:
-                x -= 1
-                decision += 2 * (y - x) + 1
+                inset = 0
+            _set_rect(rows[row], inset, row, w - 2 * inset, 1)
+        sdl2.SDL_RenderFillRects(renderer, rows, h)
+        sdl2.SDL_SetRenderDrawBlendMode(renderer, sdl2.SDL_BLENDMODE_BLEND)
+        sdl2.SDL_SetRenderTarget(renderer, previous_target)
+    # Cache failures too so unsupported backends don't retry every frame
+    _rounded_rect_cache[key] = texture
+    return texture
+
+
+def clear_rounded_rect_cache():
+    """Destroy cached rounded-rect textures (call at shutdown)"""
+    for texture in _rounded_rect_cache.values():
+        if texture:
+            sdl2.SDL_DestroyTexture(texture)
+    _rounded_rect_cache.clear()
+
+
+def _fill_rounded_rect(renderer, x, y, w, h, radius, r, g, b, a):
+    """Fill a rounded rectangle directly with a batched rect pass"""
+    # Opaque fills skip blending entirely - blending at a=255 produces the
+    # same pixels but costs a read-modify-write per pixel
+    sdl2.SDL_SetRenderDrawBlendMode(
+        renderer,
+        sdl2.SDL_BLENDMODE_NONE if a == 255 else sdl2.SDL_BLENDMODE_BLEND)
+    sdl2.SDL_SetRenderDrawColor(renderer, r, g, b, a)
+
+    # The corners are filled squares (not actually rounded), so the old
+    # corner rects were fully redundant with full-width top/bottom strips.
+    # Three non-overlapping strips cover the identical area with less than
+    # half the rects and no overdraw.
+    rects = _rounded_rects
+    # Top
+    _set_rect(rects[0], x, y, w, radius)
+    # Middle
+    _set_rect(rects[1], x, y + radius, w, h - 2 * radius)
+    # Bottom
+    _set_rect(rects[2], x, y + h - radius, w, radius)
+    sdl2.SDL_RenderFillRects(renderer, rects, 3)
 
 
 def draw_rounded_rect(renderer, x, y, w, h, radius, r, g, b, a, rotation=0, screen_width=0, screen_height=0):
@@ -197,34 +406,26 @@ def draw_rounded_rect(renderer, x, y, w, h, radius, r, g, b, a, rotation=0, scre
         tx, ty = transform_coordinates(x, y, w, h, screen_width, screen_height, rotation)
         x, y = tx, ty
     
-    # Direct rendering after coordinate transformation
-    
-    sdl2.SDL_SetRenderDrawColor(renderer, r, g, b, a)
-    
-    # Draw filled rectangles to make up the rounded rect
-    # Top
-    rect = sdl2.SDL_Rect(x + radius, y, w - 2 * radius, radius)
-    sdl2.SDL_RenderFillRect(renderer, rect)
-    # Middle
-    rect = sdl2.SDL_Rect(x, y + radius, w, h - 2 * radius)
-    sdl2.SDL_RenderFillRect(renderer, rect)
-    # Bottom
-    rect = sdl2.SDL_Rect(x + radius, y + h - radius, w - 2 * radius, radius)
-    sdl2.SDL_RenderFillRect(renderer, rect)
-    
-    # Draw circles at corners (simplified with filled rects for now)
-    # Top-left
-    rect = sdl2.SDL_Rect(x, y, radius, radius)
-    sdl2.SDL_RenderFillRect(renderer, rect)
-    # Top-right
-    rect = sdl2.SDL_Rect(x + w - radius, y, radius, radius)
-    sdl2.SDL_RenderFillRect(renderer, rect)
-    # Bottom-left
-    rect = sdl2.SDL_Rect(x, y + h - radius, radius, radius)
-    sdl2.SDL_RenderFillRect(renderer, rect)
-    # Bottom-right
-    rect = sdl2.SDL_Rect(x + w - radius, y + h - radius, radius, radius)
-    sdl2.SDL_RenderFillRect(renderer, rect)
+    # With no corner radius the shape is a plain rectangle - fill it
+    # directly instead of baking and blitting a texture for it
+    if radius <= 0:
+        sdl2.SDL_SetRenderDrawBlendMode(
+            renderer,
+            sdl2.SDL_BLENDMODE_NONE if a == 255 else sdl2.SDL_BLENDMODE_BLEND)
+        sdl2.SDL_SetRenderDrawColor(renderer, r, g, b, a)
+        sdl2.SDL_RenderFillRect(renderer, _set_rect(_scratch_rect, x, y, w, h))
+        return
+
+    # Blit the cached shape texture when available; the transform above has
+    # already rotated the geometry, so the blit itself is axis-aligned
+    texture = _get_rounded_rect_texture(renderer, w, h, radius)
+    if texture:
+        sdl2.SDL_SetTextureColorMod(texture, r, g, b)
+        sdl2.SDL_SetTextureAlphaMod(texture, a)
+        sdl2.SDL_RenderCopy(renderer, texture, None, _set_rect(_scratch_rect, x, y, w, h))
+    else:
+        # Direct rendering after coordinate transformation
+        _fill_rounded_rect(renderer, x, y, w, h, radius, r, g, b, a)
 
 
 def render_text(renderer, font, text, x, y, r, g, b, rotation=0, screen_width=0, screen_height=0):
@@ -239,57 +440,55 @@ def render_text(renderer, font, text, x, y, r, g, b, rotation=0, screen_width=0,
         rotation: Rotation angle in degrees (0, 90, 180, 270)
         screen_width, screen_height: Screen dimensions (required for rotation)
     """
-    color = sdl2.SDL_Color(r, g, b, 255)
-    surface = sdlttf.TTF_RenderUTF8_Blended(font, text.encode('utf-8'), color)
-    if not surface:
+    entry = _get_text_texture(renderer, font, text)
+    if entry is None:
         return
-    
-    texture = sdl2.SDL_CreateTextureFromSurface(renderer, surface)
-    if texture:
-        if rotation != 0:
-            # Input x,y are in layout coordinates, need to map to physical screen
-            # For 90/270: layout width->screen height, layout height->screen width
-            if rotation in (90, 270):
-                # Transform layout position to physical screen position
-                layout_center_x = x + surface.contents.w // 2
-                layout_center_y = y + surface.contents.h // 2
-                
-                # Map from layout coords to screen coords
-                # Layout is 1280x720, screen is 720x1280
-                # For 90° clockwise: layout (x,y) -> screen (screen_width-y, x)
-                # layout_x in [0, 1280] -> screen_y in [0, 1280]
-                # layout_y in [0, 720] -> screen_x in [720, 0] (inverted)
-                if rotation == 90:
-                    center_x = screen_width - layout_center_y
-                    center_y = layout_center_x
-                else:  # 270
-                    center_x = layout_center_y
-                    center_y = screen_height - layout_center_x
-            elif rotation == 180:
-                # For 180°: flip both x and y
-                layout_center_x = x + surface.contents.w // 2
-                layout_center_y = y + surface.contents.h // 2
-                center_x = screen_width - layout_center_x
-                center_y = screen_height - layout_center_y
-            else:
-                center_x = x + surface.contents.w // 2
-                center_y = y + surface.contents.h // 2
-            
-            # Place rect so its center is at computed center position
-            rect = sdl2.SDL_Rect(center_x - surface.contents.w // 2, center_y - surface.contents.h // 2, 
-                                surface.contents.w, surface.contents.h)
-            
-            print(f"render_text: text='{text[:20]}' layout pos=({x},{y}) screen center=({center_x},{center_y}) size={surface.contents.w}x{surface.contents.h} rect=({rect.x},{rect.y}) rotation={rotation}")
+    texture, text_w, text_h = entry
+    sdl2.SDL_SetTextureColorMod(texture, r, g, b)
+    
+    if rotation != 0:
+        # Input x,y are in layout coordinates, need to map to physical screen
+        # For 90/270: layout width->screen height, layout height->screen width
+        if rotation in (90, 270):
+            # Transform layout position to physical screen position
+            layout_center_x = x + text_w // 2
+            layout_center_y = y + text_h // 2
             
-            center = sdl2.SDL_Point(surface.contents.w // 2, surface.contents.h // 2)
-            sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
+            # Map from layout coords to screen coords
+            # Layout is 1280x720, screen is 720x1280
+            # For 90° clockwise: layout (x,y) -> screen (screen_width-y, x)
+            # layout_x in [0, 1280] -> screen_y in [0, 1280]
+            # layout_y in [0, 720] -> screen_x in [720, 0] (inverted)
+            if rotation == 90:
+                center_x = screen_width - layout_center_y
+                center_y = layout_center_x
+            else:  # 270
+                center_x = layout_center_y
+                center_y = screen_height - layout_center_x
+        elif rotation == 180:
+            # For 180°: flip both x and y
+            layout_center_x = x + text_w // 2
+            layout_center_y = y + text_h // 2
+            center_x = screen_width - layout_center_x
+            center_y = screen_height - layout_center_y
         else:
-            rect = sdl2.SDL_Rect(x, y, surface.contents.w, surface.contents.h)
-            sdl2.SDL_RenderCopy(renderer, texture, None, rect)
+            center_x = x + text_w // 2
+            center_y = y + text_h // 2
         
-        sdl2.SDL_DestroyTexture(texture)
-    
-    sdl2.SDL_FreeSurface(surface)
+        # Place rect so its center is at computed center position
+        rect = _set_rect(_scratch_rect, center_x - text_w // 2, center_y - text_h // 2,
+                         text_w, text_h)
+
+        logger.debug("render_text: text=%r layout pos=(%s,%s) screen center=(%s,%s) size=%sx%s rotation=%s",
+                     text[:20], x, y, center_x, center_y, text_w, text_h, rotation)
+
+        center = _scratch_point
+        center.x = text_w // 2
+        center.y = text_h // 2
+        sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
+    else:
+        rect = _set_rect(_scratch_rect, x, y, text_w, text_h)
+        sdl2.SDL_RenderCopy(renderer, texture, None, rect)
 
 
 def render_text_centered(renderer, font, text, center_x, center_y, r, g, b, rotation=0, screen_width=0, screen_height=0):
@@ -304,67 +503,153 @@ def render_text_centered(renderer, font, text, center_x, center_y, r, g, b, rota
         rotation: Rotation angle in degrees (0, 90, 180, 270)
         screen_width, screen_height: Screen dimensions (required for rotation)
     """
-    color = sdl2.SDL_Color(r, g, b, 255)
-    surface = sdlttf.TTF_RenderUTF8_Blended(font, text.encode('utf-8'), color)
-    if not surface:
+    entry = _get_text_texture(renderer, font, text)
+    if entry is None:
         return
-    
-    texture = sdl2.SDL_CreateTextureFromSurface(renderer, surface)
-    if texture:
-        if rotation != 0:
-            # Input center_x, center_y are in layout coordinates
-            # Map from layout coords to screen coords
-            if rotation in (90, 270):
-                # Layout is 1280x720, screen is 720x1280
-                # For 90° clockwise: layout (x,y) -> screen (screen_width-y, x)
-                # layout_x in [0, 1280] -> screen_y in [0, 1280]
-                # layout_y in [0, 720] -> screen_x in [720, 0] (inverted)
-                if rotation == 90:
-                    screen_center_x = screen_width - center_y
-                    screen_center_y = center_x
-                else:  # 270
-                    screen_center_x = center_y
-                    screen_center_y = screen_height - center_x
-            elif rotation == 180:
-                # For 180°: flip both x and y
-                screen_center_x = screen_width - center_x
-                screen_center_y = screen_height - center_y
-            else:
-                screen_center_x = center_x
-                screen_center_y = center_y
-            
-            # Place rect so its center is at screen center position
-            rect = sdl2.SDL_Rect(screen_center_x - surface.contents.w // 2, screen_center_y - surface.contents.h // 2,
-                                surface.contents.w, surface.contents.h)
-            
-            center = sdl2.SDL_Point(surface.contents.w // 2, surface.contents.h // 2)
-            sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
+    texture, text_w, text_h = entry
+    sdl2.SDL_SetTextureColorMod(texture, r, g, b)
+    
+    if rotation != 0:
+        # Input center_x, center_y are in layout coordinates
+        # Map from layout coords to screen coords
+        if rotation in (90, 270):
+            # Layout is 1280x720, screen is 720x1280
+            # For 90° clockwise: layout (x,y) -> screen (screen_width-y, x)
+            # layout_x in [0, 1280] -> screen_y in [0, 1280]
+            # layout_y in [0, 720] -> screen_x in [720, 0] (inverted)
+            if rotation == 90:
+                screen_center_x = screen_width - center_y
+                screen_center_y = center_x
+            else:  # 270
+                screen_center_x = center_y
+                screen_center_y = screen_height - center_x
+        elif rotation == 180:
+            # For 180°: flip both x and y
+            screen_center_x = screen_width - center_x
+            screen_center_y = screen_height - center_y
         else:
-            # Center the text (no rotation)
-            x = center_x - surface.contents.w // 2
-            y = center_y - surface.contents.h // 2
-            rect = sdl2.SDL_Rect(x, y, surface.contents.w, surface.contents.h)
-            sdl2.SDL_RenderCopy(renderer, texture, None, rect)
+            screen_center_x = center_x
+            screen_center_y = center_y
         
-        sdl2.SDL_DestroyTexture(texture)
-    
-    sdl2.SDL_FreeSurface(surface)
+        # Place rect so its center is at screen center position
+        rect = _set_rect(_scratch_rect, screen_center_x - text_w // 2, screen_center_y - text_h // 2,
+                         text_w, text_h)
+        
+        center = _scratch_point
+        center.x = text_w // 2
+        center.y = text_h // 2
+        sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
+    else:
+        # Center the text (no rotation)
+        x = center_x - text_w // 2
+        y = center_y - text_h // 2
+        rect = _set_rect(_scratch_rect, x, y, text_w, text_h)
+        sdl2.SDL_RenderCopy(renderer, texture, None, rect)
+
+
+def render_text_centered_presized(renderer, font, text, center_x, center_y, pre_w, pre_h, r, g, b, rotation=0, screen_width=0, screen_height=0):
+    """Render text centered using precomputed text dimensions
+
+    Avoids re-reading the rendered surface dimensions for strings whose size
+    is already known (e.g. the fixed button icon labels measured once at
+    startup).
+
+    Args:
+        renderer: SDL2 renderer
+        font: TTF font
+        text: Text to render
+        center_x, center_y: Center position
+        pre_w, pre_h: Precomputed width and height of the rendered text
+        r, g, b: Color components
+        rotation: Rotation angle in degrees (0, 90, 180, 270)
+        screen_width, screen_height: Screen dimensions (required for rotation)
+    """
+    entry = _get_text_texture(renderer, font, text)
+    if entry is None:
+        return
+    texture = entry[0]
+    sdl2.SDL_SetTextureColorMod(texture, r, g, b)
+
+    if rotation != 0:
+        # Map the layout-space center to physical screen coordinates
+        if rotation == 90:
+            screen_center_x = screen_width - center_y
+            screen_center_y = center_x
+        elif rotation == 270:
+            screen_center_x = center_y
+            screen_center_y = screen_height - center_x
+        elif rotation == 180:
+            screen_center_x = screen_width - center_x
+            screen_center_y = screen_height - center_y
+        else:
+            screen_center_x = center_x
+            screen_center_y = center_y
+
+        rect = _set_rect(_scratch_rect, screen_center_x - pre_w // 2, screen_center_y - pre_h // 2,
+                         pre_w, pre_h)
+        center = _scratch_point
+        center.x = pre_w // 2
+        center.y = pre_h // 2
+        sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
+    else:
+        rect = _set_rect(_scratch_rect, center_x - pre_w // 2, center_y - pre_h // 2, pre_w, pre_h)
+        sdl2.SDL_RenderCopy(renderer, texture, None, rect)
+
+
+# Memoized wrap results keyed by (font id, text, max_width). Wrapping calls
+# TTF_SizeText once per candidate break, and the title/artist inputs are
+# identical across consecutive frames, so the shaping work only needs to
+# happen when the song changes.
+_wrap_cache = {}
+_WRAP_CACHE_MAX = 128
+
+# Measured text widths keyed by (font id, text). wrap_text and
+# truncate_text probe many overlapping substrings of the same title, so
+# sharing the measurements avoids repeated shaping of identical strings.
+_size_cache = {}
+_SIZE_CACHE_MAX = 1024
+
+
+def _text_width(font, text):
+    """Get the rendered width of text, memoized per (font, text)"""
+    key = (id(font), text)
+    width = _size_cache.get(key)
+    if width is None:
+        sdlttf.TTF_SizeText(font, text.encode('utf-8'), _scratch_w, _scratch_h)
+        width = _scratch_w.value
+        if len(_size_cache) >= _SIZE_CACHE_MAX:
+            _size_cache.clear()
+        _size_cache[key] = width
+    return width
 
 
 def wrap_text(font, text, max_width):
     """Wrap text to fit within max_width, returning list of lines"""
+    key = (id(font), text, max_width)
+    cached = _wrap_cache.get(key)
+    if cached is not None:
+        return list(cached)
+    lines = _wrap_text_uncached(font, text, max_width)
+    if len(_wrap_cache) >= _WRAP_CACHE_MAX:
+        _wrap_cache.clear()
+    _wrap_cache[key] = tuple(lines)
+    return lines
+
+
+def _wrap_text_uncached(font, text, max_width):
+    # Fast path: most titles fit on one line, so measure the whole string
+    # once before doing any word-by-word break search
+    if _text_width(font, text) <= max_width:
+        return [text] if text else []
+
     words = text.split()
     lines = []
     current_line = []
-    
+
     for word in words:
         test_line = ' '.join(current_line + [word])
-        # Get text width
-        w = sdl2.c_int()
-        h = sdl2.c_int()
-        sdlttf.TTF_SizeText(font, test_line.encode('utf-8'), w, h)
-        
-        if w.value <= max_width:
+
+        if _text_width(font, test_line) <= max_width:
             current_line.append(word)
         else:
             if current_line:
@@ -380,32 +665,46 @@ def wrap_text(font, text, max_width):
     return lines
 
 
+# Memoized truncation results, same shape as _wrap_cache: the binary
+# search costs O(log n) measurements, and the inputs repeat every frame
+# until the song changes.
+_truncate_cache = {}
+_TRUNCATE_CACHE_MAX = 128
+
+
 def truncate_text(font, text, max_width):
     """Truncate text to fit within max_width with ellipsis"""
+    key = (id(font), text, max_width)
+    cached = _truncate_cache.get(key)
+    if cached is not None:
+        return cached
+    result = _truncate_text_uncached(font, text, max_width)
+    if len(_truncate_cache) >= _TRUNCATE_CACHE_MAX:
+        _truncate_cache.clear()
+    _truncate_cache[key] = result
+    return result
+
+
+def _truncate_text_uncached(font, text, max_width):
     # Check if text fits
-    w = sdl2.c_int()
-    h = sdl2.c_int()
-    sdlttf.TTF_SizeText(font, text.encode('utf-8'), w, h)
-    
-    if w.value <= max_width:
+    if _text_width(font, text) <= max_width:
         return text
-    
+
     # Binary search for the right length
     ellipsis = "..."
     left, right = 0, len(text)
     best = ""
-    
+
     while left <= right:
         mid = (left + right) // 2
         test_text = text[:mid] + ellipsis
-        sdlttf.TTF_SizeText(font, test_text.encode('utf-8'), w, h)
-        
-        if w.value <= max_width:
+
+        if _text_width(font, test_text) <= max_width:
             best = test_text
             left = mid + 1
         else:
             right = mid - 1
-    
+
     return best if best else ellipsis
 
 
@@ -3,8 +3,8 @@ Screensaver functionality with backlight control
 """
 
 import logging
+import os
 import time
-import glob
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,20 @@ class Screensaver:
         
         self.backlight_device = self._find_backlight_device()
         self.current_brightness = None
-        self.last_activity_time = time.time()
+        # Monotonic timestamps: immune to wall-clock jumps (NTP sync is
+        # common right after boot on the target devices)
+        self.last_activity_time = time.monotonic()
+        self._last_update = 0.0
+
+        # Keep the sysfs attribute open and rewrite it in place; reopening
+        # the file for every brightness change doubles the syscalls
+        self._backlight_fd = None
+        if self.backlight_device:
+            try:
+                self._backlight_fd = os.open(self.backlight_device, os.O_WRONLY)
+            except OSError as e:
+                logger.warning(f"Failed to open backlight device: {e}")
+                self.backlight_device = None
         
         if self.backlight_device:
             logger.info(f"Backlight device found: {self.backlight_device}")
@@ -47,9 +60,14 @@ class Screensaver:
         Returns:
             Path to backlight device file, or None if not found
         """
-        backlight_files = glob.glob('/sys/class/backlight/*/brightness')
-        if backlight_files:
-            return backlight_files[0]
+        try:
+            with os.scandir('/sys/class/backlight') as entries:
+                for entry in entries:
+                    path = f'/sys/class/backlight/{entry.name}/brightness'
+                    if os.path.exists(path):
+                        return path
+        except OSError:
+            pass
         return None
     
     def set_brightness(self, brightness):
@@ -61,28 +79,29 @@ class Screensaver:
         Returns:
             True if successful, False otherwise
         """
-        if self.backlight_device is None:
+        if self._backlight_fd is None:
             return False
-        
+
         if brightness == self.current_brightness:
             return True
-        
+
         try:
-            with open(self.backlight_device, 'w') as f:
-                f.write(f"{brightness}\n")
+            os.lseek(self._backlight_fd, 0, os.SEEK_SET)
+            os.write(self._backlight_fd, f"{brightness}\n".encode())
             self.current_brightness = brightness
-            logger.debug(f"Set backlight to {brightness} via {self.backlight_device}")
+            logger.debug("Set backlight to %s via %s", brightness, self.backlight_device)
             return True
-        except (PermissionError, IOError) as e:
+        except OSError as e:
             logger.warning(f"Failed to set backlight: {e}")
             return False
     
     def reset_activity(self):
         """Reset the inactivity timer (call on user interaction)"""
-        logger.info("User activity detected, resetting screensaver timer")
-        old_time = self.last_activity_time
-        self.last_activity_time = time.time()
-        logger.info(f"Activity timer reset (was {time.time() - old_time:.1f}s ago)")
+        # This runs on every touch/click, so keep the per-event logging at
+        # debug level and only log at info when the brightness actually
+        # changes
+        logger.debug("User activity detected, resetting screensaver timer")
+        self.last_activity_time = time.monotonic()
         # Always restore full brightness on activity
         if self.current_brightness != self.brightness_on:
             logger.info(f"Restoring brightness to {self.brightness_on}")
@@ -99,12 +118,18 @@ class Screensaver:
         """
         if self.backlight_device is None:
             return self.brightness_on
-        
+
+        # The timeouts have second granularity, so re-evaluating more than
+        # once a second is wasted work when this is called every frame
+        current_time = time.monotonic()
+        if current_time - self._last_update < 1.0:
+            return self.current_brightness
+        self._last_update = current_time
+
         # Reset activity timer if playing
         if is_playing:
-            self.last_activity_time = time.time()
-        
-        current_time = time.time()
+            self.last_activity_time = current_time
+
         idle_time = current_time - self.last_activity_time
         target_brightness = self.brightness_on
         
@@ -131,6 +156,15 @@ class Screensaver:
         
         return self.current_brightness
     
+    def close(self):
+        """Release the backlight file descriptor"""
+        if self._backlight_fd is not None:
+            try:
+                os.close(self._backlight_fd)
+            except OSError:
+                pass
+            self._backlight_fd = None
+
     def is_enabled(self):
         """Check if screensaver is enabled (backlight device available)
         
@@ -2,9 +2,11 @@
 UI drawing functions for Now Playing Display
 """
 
+import ctypes
 import os
 import logging
 import sdl2
+import sdl2.sdlimage as sdlimage
 import sdl2.sdlttf as sdlttf
 
 from .renderer import (
@@ -12,6 +14,7 @@ from .renderer import (
     draw_rounded_rect,
     draw_volume_slider,
     render_text_centered,
+    render_text_centered_presized,
     truncate_text,
     wrap_text,
     render_wrapped_text_centered
@@ -39,6 +42,84 @@ def get_resource_path(filename):
     return str(module_dir / filename)
 
 
+# Fonts opened by the UI code, cached by (path, size). TTF_OpenFont does a
+# full FreeType face load on every call, so the per-frame open/close pattern
+# previously used here cost several face loads per redraw.
+_font_cache = {}
+
+# Candidate paths for the smaller title/artist fonts used by the circle2
+# layout - Noto Sans for better Unicode support, DejaVu as fallback
+_FONT_PATHS_BOLD = (
+    b"/usr/share/fonts/truetype/noto/NotoSans-Bold.ttf",
+    b"/usr/share/fonts/truetype/noto/NotoSans_Condensed-Bold.ttf",
+    b"/usr/share/fonts/noto/NotoSans-Bold.ttf",
+    b"/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+)
+_FONT_PATHS_REGULAR = (
+    b"/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf",
+    b"/usr/share/fonts/truetype/noto/NotoSans_Condensed-Regular.ttf",
+    b"/usr/share/fonts/noto/NotoSans-Regular.ttf",
+    b"/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+)
+
+
+def get_cached_font(path, size):
+    """Open a font once and reuse it on subsequent calls
+    
+    Args:
+        path: Font file path (str or bytes)
+        size: Font size in points
+    
+    Returns:
+        TTF font, or None if the font could not be opened
+    """
+    if isinstance(path, str):
+        path = path.encode('utf-8')
+    key = (path, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = sdlttf.TTF_OpenFont(path, size)
+        if font:
+            _font_cache[key] = font
+    return font
+
+
+def _open_first_font(paths, size):
+    """Open the first available font from candidate paths, with caching
+    
+    The resolution result (including failure) is cached so the path list
+    is only walked once per size.
+    
+    Args:
+        paths: Tuple of candidate font file paths (bytes)
+        size: Font size in points
+    
+    Returns:
+        TTF font, or None if no candidate could be opened
+    """
+    key = (paths, size)
+    if key in _font_cache:
+        return _font_cache[key]
+    font = None
+    for path in paths:
+        try:
+            font = sdlttf.TTF_OpenFont(path, size)
+            if font:
+                break
+        except:
+            continue
+    _font_cache[key] = font
+    return font
+
+
+def close_cached_fonts():
+    """Close all cached fonts (call at shutdown)"""
+    for font in _font_cache.values():
+        if font:
+            sdlttf.TTF_CloseFont(font)
+    _font_cache.clear()
+
+
 def get_now_playing_data(demo, now_playing_data, cover_cache):
     """Get now playing data from demo or API
     
@@ -100,7 +181,7 @@ def get_button_icon_font(minimal_buttons, font_icons, size_multiplier=1.5):
         size_multiplier: Size multiplier for minimal buttons (default 1.5 for fixed size, or button_size * 0.6 for scaled)
     
     Returns:
-        Tuple of (font_icons_buttons, needs_cleanup) where needs_cleanup indicates if font should be closed later
+        The icon font to use for buttons (cached, do not close)
     """
     if minimal_buttons:
         # size_multiplier is the actual font size (e.g., button_size * 0.6 = 51.6)
@@ -108,24 +189,98 @@ def get_button_icon_font(minimal_buttons, font_icons, size_multiplier=1.5):
         # Ensure minimum font size
         if font_size < 12:
             font_size = 12
-        font_icons_buttons = sdlttf.TTF_OpenFont(get_resource_path("fonts/MaterialIcons-Regular.ttf").encode("utf-8"), font_size)
-        return font_icons_buttons, True
+        return get_cached_font(get_resource_path("fonts/MaterialIcons-Regular.ttf"), font_size)
     else:
-        return font_icons, False
+        return font_icons
+
+
+# Cache of measured icon-label dimensions, keyed by (font id, text).
+# The button icon strings are fixed, so each (font, text) pair only needs
+# to be measured once instead of on every frame.
+_icon_metrics_cache = {}
+
+
+def get_icon_metrics(font, text):
+    """Get the rendered (width, height) of a fixed icon label
+
+    Measures the text once per (font, text) pair and caches the result.
+
+    Args:
+        font: TTF font
+        text: Icon label text (e.g. "skip_previous")
+
+    Returns:
+        Tuple of (width, height) in pixels
+    """
+    key = (id(font), text)
+    metrics = _icon_metrics_cache.get(key)
+    if metrics is None:
+        w = sdl2.c_int()
+        h = sdl2.c_int()
+        sdlttf.TTF_SizeUTF8(font, text.encode('utf-8'), w, h)
+        metrics = (w.value, h.value)
+        _icon_metrics_cache[key] = metrics
+    return metrics
+
+
+# All icon labels the control row can display, used for cache pre-warming
+BUTTON_ICONS = ("skip_previous", "play_arrow", "pause", "skip_next",
+                "favorite", "favorite_border", "lyrics", "shuffle", "repeat")
+
+
+def prewarm_button_icons(renderer, font):
+    """Rasterize and measure the fixed button icons before the first frame
+
+    Populates the icon metrics and text texture caches so the first draw
+    (and the first play/pause or like toggle) costs the same as steady
+    state.
+
+    Args:
+        renderer: SDL2 renderer
+        font: Icon font the buttons will use
+    """
+    from .renderer import prewarm_text_textures
+    prewarm_text_textures(renderer, font, BUTTON_ICONS)
+    for icon in BUTTON_ICONS:
+        get_icon_metrics(font, icon)
+
+
+def render_icon_centered(renderer, font, icon, center_x, center_y, r, g, b, rotation, screen_width, screen_height):
+    """Render a fixed icon label centered at the given position
+
+    Uses cached icon dimensions to avoid remeasuring the same label
+    every frame.
+    """
+    icon_w, icon_h = get_icon_metrics(font, icon)
+    render_text_centered_presized(renderer, font, icon, center_x, center_y, icon_w, icon_h,
+                                  r, g, b, rotation, screen_width, screen_height)
+
+
+# Memoized wrap-and-truncate results, same scheme as renderer._wrap_cache:
+# the title/artist inputs repeat until the song changes, so the slicing and
+# ellipsis work only needs to happen once per new string.
+_wrap_truncate_cache = {}
+_WRAP_TRUNCATE_CACHE_MAX = 64
 
 
 def wrap_and_truncate_text(font, text, max_width, max_lines):
     """Wrap text and truncate to max lines with ellipsis
-    
+
     Args:
         font: TTF font to use for text measurement
         text: Text to wrap
         max_width: Maximum width in pixels
         max_lines: Maximum number of lines
-    
+
     Returns:
         List of text lines (truncated with ellipsis if needed)
     """
+    if not text:
+        return []
+    key = (id(font), text, max_width, max_lines)
+    cached = _wrap_truncate_cache.get(key)
+    if cached is not None:
+        return list(cached)
     wrapped = wrap_text(font, text, max_width)
     if len(wrapped) > max_lines:
         wrapped = wrapped[:max_lines]
@@ -133,6 +288,9 @@ def wrap_and_truncate_text(font, text, max_width, max_lines):
             wrapped[-1] = wrapped[-1][:-3] + "..."
         elif len(wrapped[-1]) > 0:
             wrapped[-1] = wrapped[-1] + "..."
+    if len(_wrap_truncate_cache) >= _WRAP_TRUNCATE_CACHE_MAX:
+        _wrap_truncate_cache.clear()
+    _wrap_truncate_cache[key] = tuple(wrapped)
     return wrapped
 
 
@@ -169,6 +327,62 @@ def draw_circle_outline(renderer, physical_center_x, physical_center_y, physical
     draw_circle(renderer, physical_center_x, physical_center_y, circle_radius, 0, 0, 0, 255, thickness=2)
 
 
+# Pre-rendered static background (gray clear + circle outline) per screen
+# size. The outline alone is hundreds of per-pixel points that never change
+# between frames, so render it once to a target texture and blit it.
+_background_cache = {}
+
+
+def draw_circle_background(renderer, physical_center_x, physical_center_y,
+                           physical_diameter, screen_width, screen_height):
+    """Draw the static circle-layout background via a cached texture
+    
+    On first use renders the gray clear plus circle outline into an
+    offscreen target texture; afterwards each frame is a single
+    SDL_RenderCopy. Falls back to direct drawing if render targets are
+    unavailable.
+    
+    Args:
+        renderer: SDL2 renderer
+        physical_center_x, physical_center_y: Circle center on physical screen
+        physical_diameter: Diameter of the circle
+        screen_width, screen_height: Physical screen dimensions
+    """
+    key = (screen_width, screen_height, physical_center_x, physical_center_y, physical_diameter)
+    texture = _background_cache.get(key)
+    if texture is None and key not in _background_cache:
+        texture = sdl2.SDL_CreateTexture(renderer, sdl2.SDL_PIXELFORMAT_RGBA8888,
+                                         sdl2.SDL_TEXTUREACCESS_TARGET,
+                                         screen_width, screen_height)
+        if texture:
+            # Restore whatever target was active, not None: the frame
+            # itself may be drawing into an offscreen texture
+            previous_target = sdl2.SDL_GetRenderTarget(renderer)
+            sdl2.SDL_SetRenderTarget(renderer, texture)
+            sdl2.SDL_SetRenderDrawColor(renderer, 240, 240, 240, 255)
+            sdl2.SDL_RenderClear(renderer)
+            draw_circle_outline(renderer, physical_center_x, physical_center_y, physical_diameter)
+            sdl2.SDL_SetRenderTarget(renderer, previous_target)
+        # Cache even a failed creation so we don't retry every frame
+        _background_cache[key] = texture
+    
+    if texture:
+        sdl2.SDL_RenderCopy(renderer, texture, None, None)
+    else:
+        # Render-target textures unsupported - draw directly
+        sdl2.SDL_SetRenderDrawColor(renderer, 240, 240, 240, 255)
+        sdl2.SDL_RenderClear(renderer)
+        draw_circle_outline(renderer, physical_center_x, physical_center_y, physical_diameter)
+
+
+def clear_background_cache():
+    """Destroy cached background textures (call at shutdown)"""
+    for texture in _background_cache.values():
+        if texture:
+            sdl2.SDL_DestroyTexture(texture)
+    _background_cache.clear()
+
+
 def render_control_buttons(renderer, button_y, button_size, button_spacing, center_x, total_width,
                           prev_color, play_color, next_color, like_color,
                           font_icons_buttons, minimal_buttons, liked, no_control,
@@ -201,28 +415,23 @@ def render_control_buttons(renderer, button_y, button_size, button_spacing, cent
     """
     button_rects = {}
     
+    # Build a descriptor per visible button, then draw them in one loop so
+    # the draw-call pattern exists once instead of being repeated per button
+    buttons = []
+    
     if no_control:
         # Only show like button, centered (if not hidden)
         if not hide_like_button:
             like_icon = "favorite" if liked else "favorite_border"
             like_x = center_x - button_size // 2
-            center_x_btn = like_x + button_size // 2
-            center_y_btn = button_y + button_size // 2
-            if not minimal_buttons:
-                draw_rounded_rect(renderer, like_x, button_y, button_size, button_size, border_radius, 
-                                *like_color, 255, rotation, screen_width, screen_height)
-                render_text_centered(renderer, font_icons_buttons, like_icon, 
-                                   center_x_btn, center_y_btn, 
-                                   255, 255, 255, rotation, screen_width, screen_height)
-            else:
-                render_text_centered(renderer, font_icons_buttons, like_icon, 
-                                   center_x_btn, center_y_btn, 
-                                   *like_color, rotation, screen_width, screen_height)
-            button_rects['like'] = (like_x, button_y, button_size, button_size)
+            buttons.append(('like', like_x, like_icon, like_color))
+        play_size = button_size
+        play_button_y = button_y
     else:
         # In minimal mode, make play button 30% larger
         play_size = int(button_size * 1.3) if minimal_buttons else button_size
         play_offset = (play_size - button_size) // 2  # Offset to center the larger button vertically
+        play_button_y = button_y - play_offset  # Center vertically
         
         # Calculate button positions to center them
         num_buttons = 3 if hide_like_button else 4  # prev, play, next, [like]
@@ -239,105 +448,68 @@ def render_control_buttons(renderer, button_y, button_size, button_spacing, cent
         
         # Left button (on the left side) - none, empty, lyrics, random, or loop
         if left_button != 'none':
-            left_x = buttons_start_x
             left_color = (100, 100, 100)
-            
-            # For 'empty', draw background but no icon
+            # Determine icon based on mode ('empty' draws background only)
             if left_button == 'empty':
-                if not minimal_buttons:
-                    draw_rounded_rect(renderer, left_x, button_y, button_size, button_size, border_radius, 
-                                    *left_color, 255, rotation, screen_width, screen_height)
+                left_icon = None
+            elif left_button == 'random':
+                left_icon = "shuffle"
+            elif left_button == 'loop':
+                left_icon = "repeat"
             else:
-                # Determine icon based on mode
-                if left_button == 'lyrics':
-                    left_icon = "lyrics"
-                elif left_button == 'random':
-                    left_icon = "shuffle"
-                elif left_button == 'loop':
-                    left_icon = "repeat"
-                else:
-                    left_icon = "lyrics"
-                
-                if not minimal_buttons:
-                    draw_rounded_rect(renderer, left_x, button_y, button_size, button_size, border_radius, 
-                                    *left_color, 255, rotation, screen_width, screen_height)
-                    render_text_centered(renderer, font_icons_buttons, left_icon, 
-                                       left_x + button_size // 2, button_y + button_size // 2, 
-                                       255, 255, 255, rotation, screen_width, screen_height)
-                else:
-                    render_text_centered(renderer, font_icons_buttons, left_icon, 
-                                       left_x + button_size // 2, button_y + button_size // 2, 
-                                       *left_color, rotation, screen_width, screen_height)
-            
-            button_rects['left'] = (left_x, button_y, button_size, button_size)
-        
-        # Previous button
-        if left_button != 'none':
+                left_icon = "lyrics"
+            buttons.append(('left', buttons_start_x, left_icon, left_color))
             prev_x = buttons_start_x + button_size + button_spacing
         else:
             prev_x = buttons_start_x
-        if not minimal_buttons:
-            draw_rounded_rect(renderer, prev_x, button_y, button_size, button_size, border_radius, 
-                            *prev_color, 255, rotation, screen_width, screen_height)
-            render_text_centered(renderer, font_icons_buttons, "skip_previous", 
-                               prev_x + button_size // 2, button_y + button_size // 2, 
-                               255, 255, 255, rotation, screen_width, screen_height)
-        else:
-            render_text_centered(renderer, font_icons_buttons, "skip_previous", 
-                               prev_x + button_size // 2, button_y + button_size // 2, 
-                               *prev_color, rotation, screen_width, screen_height)
-        button_rects['prev'] = (prev_x, button_y, button_size, button_size)
         
-        # Play/Pause button (larger in minimal mode)
         play_icon = "pause" if is_playing else "play_arrow"
         play_x = prev_x + button_size + button_spacing
-        play_button_y = button_y - play_offset  # Center vertically
-        
-        if not minimal_buttons:
-            draw_rounded_rect(renderer, play_x, button_y, button_size, button_size, border_radius, 
-                            *play_color, 255, rotation, screen_width, screen_height)
-            render_text_centered(renderer, font_icons_buttons, play_icon, 
-                               play_x + button_size // 2, button_y + button_size // 2, 
-                               255, 255, 255, rotation, screen_width, screen_height)
-        else:
-            # Load larger font for play button in minimal mode (160% of other buttons)
-            play_font_size = int(48 * 1.5 * 1.6)  # Base size * minimal multiplier * 60% larger
-            play_font = sdlttf.TTF_OpenFont(get_resource_path("fonts/MaterialIcons-Regular.ttf").encode("utf-8"), play_font_size)
-            render_text_centered(renderer, play_font, play_icon, 
-                               play_x + play_size // 2, play_button_y + play_size // 2, 
-                               *play_color, rotation, screen_width, screen_height)
-            sdlttf.TTF_CloseFont(play_font)
-        button_rects['play'] = (play_x, play_button_y, play_size, play_size)
-        
-        # Next button (account for larger play button in minimal mode)
         next_x = play_x + play_size + button_spacing
-        if not minimal_buttons:
-            draw_rounded_rect(renderer, next_x, button_y, button_size, button_size, border_radius, 
-                            *next_color, 255, rotation, screen_width, screen_height)
-            render_text_centered(renderer, font_icons_buttons, "skip_next", 
-                               next_x + button_size // 2, button_y + button_size // 2, 
-                               255, 255, 255, rotation, screen_width, screen_height)
-        else:
-            render_text_centered(renderer, font_icons_buttons, "skip_next", 
-                               next_x + button_size // 2, button_y + button_size // 2, 
-                               *next_color, rotation, screen_width, screen_height)
-        button_rects['next'] = (next_x, button_y, button_size, button_size)
+        
+        buttons.append(('prev', prev_x, "skip_previous", prev_color))
+        buttons.append(('play', play_x, play_icon, play_color))
+        buttons.append(('next', next_x, "skip_next", next_color))
         
         # Like button (if not hidden)
         if not hide_like_button:
             like_icon = "favorite" if liked else "favorite_border"
             like_x = next_x + button_size + button_spacing
+            buttons.append(('like', like_x, like_icon, like_color))
+    
+    half_size = button_size // 2
+    icon_cy = button_y + half_size
+
+    # Two passes so consecutive draw calls share a texture: all backgrounds
+    # blit from the cached rounded-rect shape first, then all icons from
+    # their cached string textures. Runs of same-texture copies let SDL's
+    # render batching submit each group as one draw call.
+    if not minimal_buttons:
+        for name, x, icon, color in buttons:
+            draw_rounded_rect(renderer, x, button_y, button_size, button_size, border_radius,
+                            *color, 255, rotation, screen_width, screen_height)
+
+    for name, x, icon, color in buttons:
+        if name == 'play' and minimal_buttons and not no_control:
+            # Larger font for play button in minimal mode (160% of other buttons)
+            play_font_size = int(48 * 1.5 * 1.6)  # Base size * minimal multiplier * 60% larger
+            play_font = get_cached_font(get_resource_path("fonts/MaterialIcons-Regular.ttf"), play_font_size)
+            render_text_centered(renderer, play_font, icon,
+                               x + play_size // 2, play_button_y + play_size // 2,
+                               *color, rotation, screen_width, screen_height)
+            button_rects[name] = (x, play_button_y, play_size, play_size)
+            continue
+
+        if icon:
             if not minimal_buttons:
-                draw_rounded_rect(renderer, like_x, button_y, button_size, button_size, border_radius, 
-                                *like_color, 255, rotation, screen_width, screen_height)
-                render_text_centered(renderer, font_icons_buttons, like_icon, 
-                                   like_x + button_size // 2, button_y + button_size // 2, 
+                render_icon_centered(renderer, font_icons_buttons, icon,
+                                   x + half_size, icon_cy,
                                    255, 255, 255, rotation, screen_width, screen_height)
             else:
-                render_text_centered(renderer, font_icons_buttons, like_icon, 
-                                   like_x + button_size // 2, button_y + button_size // 2, 
-                                   *like_color, rotation, screen_width, screen_height)
-            button_rects['like'] = (like_x, button_y, button_size, button_size)
+                render_icon_centered(renderer, font_icons_buttons, icon,
+                                   x + half_size, icon_cy,
+                                   *color, rotation, screen_width, screen_height)
+        button_rects[name] = (x, button_y, button_size, button_size)
     
     # Draw circles around buttons if round_controls is enabled
     if round_controls:
@@ -355,9 +527,107 @@ def render_control_buttons(renderer, button_y, button_size, button_spacing, cent
     return button_rects
 
 
+# Cache of decoded cover art textures, keyed by image file path.
+# Decoding a JPEG/PNG and uploading it to the GPU every frame is by far
+# the most expensive part of the draw loop, and the cover only changes
+# on track transitions, so keep the decoded texture until the path changes.
+_cover_texture_cache = {}
+_COVER_CACHE_MAX = 4
+
+# Reusable scratch structures for cover blits (see renderer._scratch_rect)
+_cover_rect = sdl2.SDL_Rect()
+_cover_center = sdl2.SDL_Point()
+
+# Preferred texture pixel format of the renderer, queried once. Scaling the
+# cover into this format up front means SDL_CreateTextureFromSurface can
+# upload the pixels directly instead of converting the whole surface first.
+_renderer_format = None
+
+
+def _get_renderer_format(renderer):
+    """Get the renderer's preferred 32-bit texture pixel format"""
+    global _renderer_format
+    if _renderer_format is None:
+        fmt = sdl2.SDL_PIXELFORMAT_RGBA8888
+        info = sdl2.SDL_RendererInfo()
+        if sdl2.SDL_GetRendererInfo(renderer, ctypes.byref(info)) == 0:
+            for i in range(info.num_texture_formats):
+                candidate = info.texture_formats[i]
+                if sdl2.SDL_BYTESPERPIXEL(candidate) == 4:
+                    fmt = candidate
+                    break
+        _renderer_format = fmt
+    return _renderer_format
+
+
+def _get_cover_texture(renderer, imagefile, size):
+    """Get a cached SDL texture for a cover image, decoding it on first use
+
+    The image is scaled to the display size at cache insertion, so the
+    texture holds only the pixels that are actually drawn instead of the
+    full-resolution download.
+
+    Args:
+        renderer: SDL2 renderer
+        imagefile: Path to the cover image file
+        size: Target display size (width and height) in pixels
+
+    Returns:
+        SDL_Texture, or None if the image could not be loaded
+    """
+    # Key on mtime as well so a re-downloaded cover at the same path (the
+    # cover cache reuses filenames) replaces the stale texture
+    try:
+        mtime = os.path.getmtime(imagefile)
+    except OSError:
+        return None
+    key = (imagefile, mtime, size)
+
+    texture = _cover_texture_cache.get(key)
+    if texture is not None:
+        # Re-insert to mark as most recently used (dicts keep insertion order)
+        _cover_texture_cache.pop(key)
+        _cover_texture_cache[key] = texture
+        return texture
+
+    surface = sdlimage.IMG_Load(imagefile.encode('utf-8'))
+    if not surface:
+        return None
+
+    # Downscale once here rather than letting every blit sample the
+    # full-resolution image. Using the renderer's own pixel format skips
+    # the format conversion SDL_CreateTextureFromSurface would otherwise
+    # do on the whole image.
+    # The texture keeps its own pixel copy, so free both surfaces as soon
+    # as it exists; the finally guarantees that even if a call in between
+    # raises, the decode buffers do not outlive this function
+    scaled = None
+    try:
+        scaled = sdl2.SDL_CreateRGBSurfaceWithFormat(0, size, size, 32,
+                                                     _get_renderer_format(renderer))
+        if scaled:
+            sdl2.SDL_BlitScaled(surface, None, scaled, None)
+            texture = sdl2.SDL_CreateTextureFromSurface(renderer, scaled)
+        else:
+            texture = sdl2.SDL_CreateTextureFromSurface(renderer, surface)
+    finally:
+        if scaled:
+            sdl2.SDL_FreeSurface(scaled)
+        sdl2.SDL_FreeSurface(surface)
+    if not texture:
+        return None
+
+    # Evict the least recently used cover so memory stays bounded across skips
+    while len(_cover_texture_cache) >= _COVER_CACHE_MAX:
+        oldest_key = next(iter(_cover_texture_cache))
+        sdl2.SDL_DestroyTexture(_cover_texture_cache.pop(oldest_key))
+    _cover_texture_cache[key] = texture
+    return texture
+
+
 def render_coverart(renderer, x, y, size, imagefile, font_icons, rotation=0, screen_width=0, screen_height=0):
     """Render album cover art or placeholder
-    
+
     Args:
         renderer: SDL2 renderer
         x, y: Top-left position
@@ -367,61 +637,57 @@ def render_coverart(renderer, x, y, size, imagefile, font_icons, rotation=0, scr
         rotation: Rotation angle in degrees
         screen_width, screen_height: Physical screen dimensions
     """
-    import sdl2.sdlimage as sdlimage
-    
     # Draw background square
     draw_rounded_rect(renderer, x, y, size, size, 20, 100, 100, 100, 255, rotation, screen_width, screen_height)
-    
-    if imagefile and os.path.exists(imagefile):
-        # Load and render the image
-        surface = sdlimage.IMG_Load(imagefile.encode('utf-8'))
-        if surface:
-            texture = sdl2.SDL_CreateTextureFromSurface(renderer, surface)
-            if texture:
-                # Transform coordinates for rotation if needed
-                if rotation in [90, 270]:
-                    # Transform layout coordinates to screen coordinates
-                    if rotation == 90:
-                        screen_x = screen_width - (y + size)
-                        screen_y = x
-                    else:  # 270
-                        screen_x = y
-                        screen_y = screen_height - (x + size)
-                    
-                    # Create rect in screen coordinates
-                    rect = sdl2.SDL_Rect(screen_x, screen_y, size, size)
-                    
-                    center = sdl2.SDL_Point(size // 2, size // 2)
-                    sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
-                else:
-                    # For 0° and 180° rotations
-                    if rotation == 180:
-                        # Transform coordinates for 180° rotation
-                        screen_x = screen_width - (x + size)
-                        screen_y = screen_height - (y + size)
-                        rect = sdl2.SDL_Rect(screen_x, screen_y, size, size)
-                    else:
-                        rect = sdl2.SDL_Rect(x, y, size, size)
-                    
-                    if rotation == 180:
-                        center = sdl2.SDL_Point(size // 2, size // 2)
-                        sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
-                    else:
-                        sdl2.SDL_RenderCopy(renderer, texture, None, rect)
-                
-                sdl2.SDL_DestroyTexture(texture)
-            sdl2.SDL_FreeSurface(surface)
+
+    # _get_cover_texture stats the file itself (for its mtime key), so a
+    # separate existence check would just double the syscall; a missing or
+    # unreadable file yields None and falls through to the placeholder
+    texture = _get_cover_texture(renderer, imagefile, size) if imagefile else None
+    if texture:
+        # Transform coordinates for rotation if needed
+        if rotation in [90, 270]:
+            # Transform layout coordinates to screen coordinates
+            if rotation == 90:
+                screen_x = screen_width - (y + size)
+                screen_y = x
+            else:  # 270
+                screen_x = y
+                screen_y = screen_height - (x + size)
+
+            # Create rect in screen coordinates
+            rect = _cover_rect
+            rect.x, rect.y, rect.w, rect.h = screen_x, screen_y, size, size
+
+            center = _cover_center
+            center.x = center.y = size // 2
+            sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
+        else:
+            # For 0° and 180° rotations
+            rect = _cover_rect
+            if rotation == 180:
+                # Transform coordinates for 180° rotation
+                screen_x = screen_width - (x + size)
+                screen_y = screen_height - (y + size)
+                rect.x, rect.y, rect.w, rect.h = screen_x, screen_y, size, size
+            else:
+                rect.x, rect.y, rect.w, rect.h = x, y, size, size
+
+            if rotation == 180:
+                center = _cover_center
+                center.x = center.y = size // 2
+                sdl2.SDL_RenderCopyEx(renderer, texture, None, rect, rotation, center, sdl2.SDL_FLIP_NONE)
+            else:
+                sdl2.SDL_RenderCopy(renderer, texture, None, rect)
     else:
         # Draw placeholder icon (larger size)
         album_icon = "album"
         # Use a larger font size for the icon - scale with cover size
         icon_size = int(size * 0.4)  # 40% of cover size
-        font_path = get_resource_path('fonts/MaterialIcons-Regular.ttf')
-        font_icons_large = sdlttf.TTF_OpenFont(font_path.encode('utf-8'), icon_size)
+        font_icons_large = get_cached_font(get_resource_path('fonts/MaterialIcons-Regular.ttf'), icon_size)
         if font_icons_large:
             render_text_centered(renderer, font_icons_large, album_icon, 
                                x + size // 2, y + size // 2, 200, 200, 200, rotation, screen_width, screen_height)
-            sdlttf.TTF_CloseFont(font_icons_large)
 
 
 def draw_now_playing_ui_portrait(renderer, width, height, font_large, font_medium, font_small, font_icons, bw_buttons=False, no_control=False, minimal_buttons=False, liked=False, rotation=0, screen_width=0, screen_height=0, demo=False, now_playing_data=None, cover_cache=None, hide_like_button=False, round_controls=False, debug=False, left_button='lyrics', volume_slider=False, volume=50):
@@ -489,7 +755,7 @@ def draw_now_playing_ui_portrait(renderer, width, height, font_large, font_mediu
     
     # Load icon font for buttons - scale with button size
     button_font_size = int(button_size * 0.6)  # Icons are 60% of button size
-    font_icons_buttons, needs_font_cleanup = get_button_icon_font(minimal_buttons, font_icons, button_font_size)
+    font_icons_buttons = get_button_icon_font(minimal_buttons, font_icons, button_font_size)
     
     # Render control buttons
     button_rects = render_control_buttons(
@@ -512,9 +778,6 @@ def draw_now_playing_ui_portrait(renderer, width, height, font_large, font_mediu
         button_rects['volume_slider'] = slider_rect
         button_rects['volume_handle'] = handle_rect
     
-    if needs_font_cleanup:
-        sdlttf.TTF_CloseFont(font_icons_buttons)
-    
     return button_rects
 
 
@@ -605,7 +868,7 @@ def draw_now_playing_ui_landscape(renderer, width, height, font_large, font_medi
     
     # Load icon font for buttons - scale with button size
     button_font_size = int(button_size * 0.6)  # Icons are 60% of button size
-    font_icons_buttons, needs_font_cleanup = get_button_icon_font(minimal_buttons, font_icons, button_font_size)
+    font_icons_buttons = get_button_icon_font(minimal_buttons, font_icons, button_font_size)
     
     # Render control buttons
     button_rects = render_control_buttons(
@@ -630,9 +893,6 @@ def draw_now_playing_ui_landscape(renderer, width, height, font_large, font_medi
         button_rects['volume_slider'] = slider_rect
         button_rects['volume_handle'] = handle_rect
     
-    if needs_font_cleanup:
-        sdlttf.TTF_CloseFont(font_icons_buttons)
-    
     return button_rects
 
 
@@ -658,16 +918,13 @@ def draw_now_playing_ui_circle(renderer, width, height, font_large, font_medium,
         state = now_playing_data.get('state', '').lower()
         is_playing = state == 'playing'
     
-    # Clear screen to light gray background
-    sdl2.SDL_SetRenderDrawColor(renderer, 240, 240, 240, 255)
-    sdl2.SDL_RenderClear(renderer)
-    
     # Setup circle layout
     physical_diameter, physical_center_x, physical_center_y, diameter, circle_center_x, circle_center_y = \
         setup_circle_layout(screen_width, screen_height, width, height)
     
-    # Draw circle outline
-    draw_circle_outline(renderer, physical_center_x, physical_center_y, physical_diameter)
+    # Static background: gray clear + circle outline, cached as a texture
+    draw_circle_background(renderer, physical_center_x, physical_center_y,
+                           physical_diameter, screen_width, screen_height)
     
     # Calculate layout elements within the circle
     padding = int(diameter * 0.05)  # 5% of diameter
@@ -709,7 +966,7 @@ def draw_now_playing_ui_circle(renderer, width, height, font_large, font_medium,
     prev_color, play_color, next_color, like_color = get_button_colors(bw_buttons)
     
     # Load icon font for buttons
-    font_icons_buttons, needs_font_cleanup = get_button_icon_font(minimal_buttons, font_icons, button_size * 0.6)
+    font_icons_buttons = get_button_icon_font(minimal_buttons, font_icons, button_size * 0.6)
     
     # Render control buttons
     button_rects = render_control_buttons(
@@ -719,9 +976,6 @@ def draw_now_playing_ui_circle(renderer, width, height, font_large, font_medium,
         rotation, screen_width, screen_height, border_radius=int(button_size * 0.35), hide_like_button=hide_like_button, is_playing=is_playing, round_controls=round_controls, debug=debug, left_button=left_button
     )
     
-    if needs_font_cleanup:
-        sdlttf.TTF_CloseFont(font_icons_buttons)
-    
     return button_rects
 
 
@@ -747,16 +1001,13 @@ def draw_now_playing_ui_circle2(renderer, width, height, font_large, font_medium
         state = now_playing_data.get('state', '').lower()
         is_playing = state == 'playing'
     
-    # Clear screen to light gray background
-    sdl2.SDL_SetRenderDrawColor(renderer, 240, 240, 240, 255)
-    sdl2.SDL_RenderClear(renderer)
-    
     # Setup circle layout
     physical_diameter, physical_center_x, physical_center_y, diameter, circle_center_x, circle_center_y = \
         setup_circle_layout(screen_width, screen_height, width, height)
     
-    # Draw circle outline
-    draw_circle_outline(renderer, physical_center_x, physical_center_y, physical_diameter)
+    # Static background: gray clear + circle outline, cached as a texture
+    draw_circle_background(renderer, physical_center_x, physical_center_y,
+                           physical_diameter, screen_width, screen_height)
     
     # Calculate layout elements within the circle
     padding = int(diameter * 0.05)  # 5% of diameter
@@ -772,38 +1023,9 @@ def draw_now_playing_ui_circle2(renderer, width, height, font_large, font_medium
     # Render album cover at the top
     render_coverart(renderer, cover_x, cover_y, cover_size, cover_file, font_icons, rotation, screen_width, screen_height)
     
-    # Load smaller fonts (20% smaller: 48->38, 42->34) - using Noto Sans for better Unicode support
-    # Try multiple font paths for better compatibility
-    font_paths_bold = [
-        b"/usr/share/fonts/truetype/noto/NotoSans-Bold.ttf",
-        b"/usr/share/fonts/truetype/noto/NotoSans_Condensed-Bold.ttf",
-        b"/usr/share/fonts/noto/NotoSans-Bold.ttf",
-        b"/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-    ]
-    font_paths_regular = [
-        b"/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf",
-        b"/usr/share/fonts/truetype/noto/NotoSans_Condensed-Regular.ttf",
-        b"/usr/share/fonts/noto/NotoSans-Regular.ttf",
-        b"/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-    ]
-    
-    font_large_small = None
-    for path in font_paths_bold:
-        try:
-            font_large_small = sdlttf.TTF_OpenFont(path, 38)
-            if font_large_small:
-                break
-        except:
-            continue
-    
-    font_medium_small = None
-    for path in font_paths_regular:
-        try:
-            font_medium_small = sdlttf.TTF_OpenFont(path, 34)
-            if font_medium_small:
-                break
-        except:
-            continue
+    # Smaller fonts (20% smaller: 48->38, 42->34), opened once and cached
+    font_large_small = _open_first_font(_FONT_PATHS_BOLD, 38)
+    font_medium_small = _open_first_font(_FONT_PATHS_REGULAR, 34)
     
     # Song title below the cover - wrap to 70% of diameter
     max_text_width = int(diameter * 0.7)
@@ -822,12 +1044,6 @@ def draw_now_playing_ui_circle2(renderer, width, height, font_large, font_medium
     for i, line in enumerate(wrapped_artist):
         render_text_centered(renderer, font_medium_small, line, circle_center_x, artist_y + i * 40, 100, 100, 100, rotation, screen_width, screen_height)
     
-    # Clean up smaller fonts
-    if font_large_small:
-        sdlttf.TTF_CloseFont(font_large_small)
-    if font_medium_small:
-        sdlttf.TTF_CloseFont(font_medium_small)
-    
     # Control buttons at the bottom of the circle
     button_size = int(diameter * 0.12)  # 12% of diameter
     button_spacing = int(diameter * 0.03)  # 3% of diameter
@@ -837,7 +1053,7 @@ def draw_now_playing_ui_circle2(renderer, width, height, font_large, font_medium
     prev_color, play_color, next_color, like_color = get_button_colors(bw_buttons)
     
     # Load icon font for buttons
-    font_icons_buttons, needs_font_cleanup = get_button_icon_font(minimal_buttons, font_icons, button_size * 0.6)
+    font_icons_buttons = get_button_icon_font(minimal_buttons, font_icons, button_size * 0.6)
     
     # Render control buttons
     button_rects = render_control_buttons(
@@ -847,7 +1063,4 @@ def draw_now_playing_ui_circle2(renderer, width, height, font_large, font_medium
         rotation, screen_width, screen_height, border_radius=int(button_size * 0.35), hide_like_button=hide_like_button, is_playing=is_playing, round_controls=round_controls, debug=debug, left_button=left_button
     )
     
-    if needs_font_cleanup:
-        sdlttf.TTF_CloseFont(font_icons_buttons)
-    
     return button_rects